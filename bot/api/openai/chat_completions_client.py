@@ -3,7 +3,7 @@ chat_completions_client.py
 Core LLM client logic for the bot.
 """
 
-from typing import List, Literal, Dict, Any, Iterable
+from typing import List, Literal, Dict, Any, Iterable, AsyncIterator, Optional
 from openai import AsyncOpenAI
 import os
 
@@ -123,26 +123,73 @@ class ChatCompletionsClient:
         if not self.api_key:
             raise EnvironmentError("OPENAI_API_KEY environment variable is not set.")
 
-    async def chat(self, history: List[Dict[str, Any]]) -> str:
+    async def chat(
+        self,
+        history: List[Dict[str, Any]],
+        *,
+        raise_errors: bool = False,
+        max_tokens: Optional[int] = None,
+        response_format: Optional[Dict[str, Any]] = None,
+        temperature: Optional[float] = None,
+    ) -> str:
         """
         Chat with the LLM model, maintaining message history per session.
         Args:
             history: List of message dicts with 'role' and 'content'.
+            raise_errors: Raise API errors instead of returning them as the reply text.
+            max_tokens: Cap on reply tokens, overriding the model's default limit.
+            response_format: OpenAI response_format, e.g. {"type": "json_object"}.
+            temperature: Sampling temperature (omit for models that only support the default).
         Returns:
             The assistant's reply as a string.
         """
 
         try:
             openai_history = transform_history_to_openai(history)
+            model_arguments = transform_arguments_for_model(self.model)
+            if max_tokens is not None:
+                limit_key = "max_completion_tokens" if "max_completion_tokens" in model_arguments else "max_tokens"
+                model_arguments[limit_key] = max_tokens
+            if response_format is not None:
+                model_arguments["response_format"] = response_format
+            if temperature is not None:
+                model_arguments["temperature"] = temperature
             response = await openai.chat.completions.create(
                 messages=openai_history,
-                **transform_arguments_for_model(self.model),
+                **model_arguments,
             )
             return response.choices[0].message.content or ""
         except Exception as e:
+            if raise_errors:
+                raise
             logger.error(f"Failed to generate response: {e}")
             return "There was an error: " + str(e)
 
+    async def chat_stream(self, history: List[Dict[str, Any]]) -> AsyncIterator[str]:
+        """
+        Stream the LLM reply as content deltas arrive.
+        Unlike chat(), errors are raised to the caller rather than returned as text.
+        Callers that may stop early should close the generator (contextlib.aclosing)
+        so the underlying response is released right away.
+        Args:
+            history: List of message dicts with 'role' and 'content'.
+        Yields:
+            Non-empty chunks of the assistant's reply, in order.
+        """
+        openai_history = transform_history_to_openai(history)
+        stream = await openai.chat.completions.create(
+            messages=openai_history,
+            stream=True,
+            **transform_arguments_for_model(self.model),
+        )
+        try:
+            async for chunk in stream:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    yield chunk.choices[0].delta.content
+        finally:
+            # Release the HTTP response even if the caller stops reading early
+            await stream.close()
+
     async def summarize(self, text: str) -> str:
         prompt = (
             "Summarize the following text in a concise manner:\n\n"
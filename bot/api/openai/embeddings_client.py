@@ -0,0 +1,54 @@
+"""
+embeddings_client.py
+OpenAI embeddings client for the bot.
+"""
+
+import math
+import os
+from typing import List, Sequence
+
+from openai import AsyncOpenAI
+
+from bot.app.utils.logger import get_logger
+
+logger = get_logger()
+
+openai = AsyncOpenAI()
+
+
+class EmbeddingsClient:
+    DEFAULT_MODEL = "text-embedding-3-small"
+
+    def __init__(self, model: str = DEFAULT_MODEL):
+        self.model = model
+        self.api_key = os.getenv("OPENAI_API_KEY")
+        if not self.api_key:
+            raise EnvironmentError("OPENAI_API_KEY environment variable is not set.")
+
+    async def embed(self, texts: List[str]) -> List[List[float]]:
+        """
+        Embed all texts in a single batched request.
+        Args:
+            texts: Non-empty strings to embed.
+        Returns:
+            One vector per input text, in input order.
+        """
+        if not texts:
+            return []
+
+        response = await openai.embeddings.create(model=self.model, input=texts)
+        return [item.embedding for item in sorted(response.data, key=lambda item: item.index)]
+
+    @staticmethod
+    def factory(model: str = DEFAULT_MODEL) -> "EmbeddingsClient":
+        return EmbeddingsClient(model=model)
+
+
+def cosine_similarity(a: Sequence[float], b: Sequence[float]) -> float:
+    """Cosine similarity of two vectors (0.0 if either is all zeros)."""
+    dot = sum(x * y for x, y in zip(a, b))
+    norm_a = math.sqrt(sum(x * x for x in a))
+    norm_b = math.sqrt(sum(y * y for y in b))
+    if not norm_a or not norm_b:
+        return 0.0
+    return dot / (norm_a * norm_b)
@@ -7,6 +7,7 @@ https://opentdb.com/api.php
 import asyncio
 import html
 import logging
+import time
 from typing import Dict, List, Optional
 
 import aiohttp
@@ -15,6 +16,22 @@ logger = logging.getLogger(__name__)
 
 BASE_URL = "https://opentdb.com/api.php"
 
+# OpenTDB allows one request per 5 seconds per IP; keep a little slack
+MIN_REQUEST_INTERVAL = 5.5
+
+_request_lock = asyncio.Lock()
+_last_request_at = float("-inf")
+
+
+async def _wait_for_rate_limit() -> None:
+    """Space requests from this process at least MIN_REQUEST_INTERVAL apart."""
+    global _last_request_at
+    async with _request_lock:
+        wait_time = _last_request_at + MIN_REQUEST_INTERVAL - time.monotonic()
+        if wait_time > 0:
+            await asyncio.sleep(wait_time)
+        _last_request_at = time.monotonic()
+
 
 class OpenTDBClient:
     """HTTP client for OpenTDB API."""
@@ -61,6 +78,7 @@ class OpenTDBClient:
 
         for attempt in range(self.max_retries):
             try:
+                await _wait_for_rate_limit()
                 timeout = aiohttp.ClientTimeout(total=self.timeout)
                 async with aiohttp.ClientSession(timeout=timeout) as session:
                     async with session.get(BASE_URL, params=params) as response:
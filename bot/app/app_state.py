@@ -4,8 +4,8 @@ import copy
 import json
 import os
 
-# Define the path for the state file
-STATE_FILE_PATH = os.path.join(os.path.dirname(__file__), "app_state.json")
+# Define the path for the state file (APP_STATE_PATH overrides it, e.g. in tests)
+STATE_FILE_PATH = os.getenv("APP_STATE_PATH") or os.path.join(os.path.dirname(__file__), "app_state.json")
 GUILD_CONFIG_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), ".guild_config.json")
 
 # Initialize the application state (default structure)
@@ -33,7 +33,7 @@ from bot.app.redis.locks import redis_lock
 from bot.app.redis.client import get_redis_client, initialize_redis, close_redis
 from bot.app.redis.exceptions import LockAcquisitionError
 from bot.app.story_history import get_channel_dedup_window, cleanup_old_history
-from bot.domain.news.news_summary_service import generate_news_summary
+from bot.domain.news.news_summary_service import generate_news_summary, get_channel_article_limits
 
 logger = logging.getLogger("RSSSummaryPoster")
 logging.basicConfig(
@@ -48,6 +48,10 @@ DISCORD_ERROR_UNKNOWN_GUILD = 10004
 DISCORD_ERROR_MISSING_ACCESS = 50001
 DISCORD_ERROR_MISSING_PERMISSIONS = 50013
 
+# Channel lock TTL; must outlast a slow edition (every LLM stage plus retries and
+# posting) so the next 10-minute tick can't take the lock and post a duplicate
+SUMMARY_LOCK_TIMEOUT_SECONDS = 1800
+
 # Summary times in Pacific timezone (24-hour format)
 SUMMARY_TIMES = [
     (8, 0),   # 8:00 AM
@@ -329,12 +333,12 @@ async def post_summaries() -> None:
     async def on_ready():
         logger.info("Discord client logged in as %s (Redis mode)", client.user)
 
-        for channel_id, data in channel_articles.items():
+        async def process_channel(channel_id: int, data: Dict[str, Any]) -> None:
             # Distributed lock per channel to prevent duplicate summaries
             lock_resource = f"rss:{data['guild_id']}:summary:{channel_id}"
 
             try:
-                async with redis_lock(redis_client, lock_resource, timeout=600):
+                async with redis_lock(redis_client, lock_resource, timeout=SUMMARY_LOCK_TIMEOUT_SECONDS):
                     logger.info(f"Acquired summary lock for channel {channel_id}")
 
                     articles = data["articles"]
@@ -347,7 +351,7 @@ async def post_summaries() -> None:
 
                     if not should_post:
                         logger.info(f"Not time for summary in channel {channel_id}, skipping")
-                        continue
+                        return
 
                     # IMPORTANT: Check if channel exists BEFORE generating expensive summary
                     try:
@@ -357,30 +361,30 @@ async def post_summaries() -> None:
 
                         if not isinstance(channel, (discord.TextChannel, discord.Thread)):
                             logger.warning(f"Channel ID {channel_id} is not a text channel, skipping")
-                            continue
+                            return
 
                     except discord.Forbidden as exc:
                         logger.error(f"PERMANENT: Missing permissions for channel {channel_id}: {exc}")
                         _cleanup_inaccessible_channel(guild_id, channel_id, "Missing permissions")
-                        continue
+                        return
 
                     except discord.HTTPException as exc:
                         if exc.code == DISCORD_ERROR_UNKNOWN_CHANNEL:  # 10003: Unknown Channel
                             logger.error(f"PERMANENT: Channel {channel_id} does not exist (404)")
                             _cleanup_inaccessible_channel(guild_id, channel_id, "Channel deleted")
-                            continue
+                            return
                         elif exc.code == DISCORD_ERROR_MISSING_PERMISSIONS:  # 50013: Missing Access
                             logger.error(f"PERMANENT: No access to channel {channel_id} (403)")
                             _cleanup_inaccessible_channel(guild_id, channel_id, "Access denied")
-                            continue
+                            return
                         else:
                             # Transient error - log and skip this run
                             logger.warning(f"TRANSIENT: HTTP error accessing channel {channel_id} (code {exc.code}): {exc}")
-                            continue
+                            return
 
                     except Exception as exc:
                         logger.error(f"Unexpected error checking channel {channel_id}: {exc}")
-                        continue
+                        return
 
                     logger.info(f"Channel {channel_id} verified, proceeding with summary generation")
 
@@ -407,7 +411,7 @@ async def post_summaries() -> None:
 
                         if not articles:
                             logger.info(f"No articles remaining after filtering orphaned feeds for channel {channel_id}")
-                            continue
+                            return
 
                     logger.info(f"Generating {edition} summary for channel {channel_id}: {len(articles)} articles from {len(feed_names)} feeds")
 
@@ -417,7 +421,6 @@ async def post_summaries() -> None:
                     logger.info(f"Using {window_hours}h dedup window for channel {channel_id}")
 
                     # Load article processing limits for this channel
-                    from bot.domain.news.news_summary_service import get_channel_article_limits
                     limits = get_channel_article_limits(guild_id, channel_id)
                     logger.info(f"Using limits for channel {channel_id}: {limits['initial_limit']} → {limits['top_articles_limit']} → {limits['cluster_limit']}")
 
@@ -449,7 +452,7 @@ async def post_summaries() -> None:
                         )
                     except Exception as e:
                         logger.error(f"Failed to generate summary for channel {channel_id}: {e}")
-                        continue
+                        return
 
                     # Get stats and story summaries
                     story_summaries = summary_result.get("story_summaries", [])
@@ -478,7 +481,7 @@ async def post_summaries() -> None:
                     except Exception as e:
                         logger.error(f"CRITICAL: Failed to pre-save timestamp for channel {channel_id}: {e}")
                         # Don't continue - if we can't save timestamp, we'll have infinite retries
-                        continue
+                        return
 
                     # NOW try to post (channel already verified, timestamp already saved)
                     try:
@@ -504,23 +507,23 @@ async def post_summaries() -> None:
                         # Permissions changed since we verified - cleanup
                         logger.error(f"PERMANENT: Lost permissions for channel {channel_id}: {exc}")
                         _cleanup_inaccessible_channel(guild_id, channel_id, "Lost permissions")
-                        continue
+                        return
 
                     except discord.HTTPException as exc:
                         # Unlikely since we already verified channel exists, but handle anyway
                         if exc.code == DISCORD_ERROR_UNKNOWN_CHANNEL:
                             logger.error(f"PERMANENT: Channel {channel_id} deleted after verification: {exc}")
                             _cleanup_inaccessible_channel(guild_id, channel_id, "Channel deleted")
-                            continue
+                            return
                         else:
                             # Transient error (rate limit, server error, etc)
                             logger.warning(f"TRANSIENT: HTTP error posting to channel {channel_id} (code {exc.code}): {exc}")
                             logger.warning(f"Will retry next scheduled run (timestamp already saved)")
-                            continue
+                            return
 
                     except Exception as exc:
                         logger.error(f"Unexpected error posting to channel {channel_id}: {exc}")
-                        continue
+                        return
 
                     # Clear pending articles from Redis
                     try:
@@ -541,11 +544,15 @@ async def post_summaries() -> None:
 
             except LockAcquisitionError:
                 logger.info(f"Channel {channel_id} is being processed by another container, skipping")
-                continue
 
             except Exception as e:
                 logger.error(f"Error processing channel {channel_id}: {e}")
-                continue
+
+        # Channels are independent (each holds its own lock), so generate their editions concurrently
+        await asyncio.gather(*(
+            process_channel(channel_id, data)
+            for channel_id, data in channel_articles.items()
+        ))
 
         logger.info("=== RSS Summary Poster Finished ===")
 
@@ -521,7 +521,8 @@ async def post_trivia_questions() -> None:
     async def on_ready():
         logger.info("Discord client logged in as %s (Redis mode)", client.user)
 
-        for game_info in to_post:
+        async def post_game(game_info: Dict[str, Any]) -> None:
+            """Generate and post one scheduled game; errors are logged, not raised."""
             guild_id = game_info["guild_id"]
             reg_id = game_info["registration_id"]
             registration = game_info["registration"]
@@ -539,7 +540,7 @@ async def post_trivia_questions() -> None:
 
                 if not isinstance(channel, discord.TextChannel):
                     logger.warning("Channel ID %s is not a text channel", channel_id)
-                    continue
+                    return
 
                 # Get method from registration
                 method = registration.get("method", "OpenTrivia")
@@ -590,7 +591,8 @@ async def post_trivia_questions() -> None:
 
                     # Generate AI questions if any AI counts > 0
                     ai_questions = []
-                    used_seeds_for_ai = set()
+                    # Seeds picked by the AI fallback (if OpenTDB failed) must be persisted too
+                    used_seeds_for_ai = {q["seed"] for q in opentdb_questions if q.get("source") == "ai"}
                     if ai_total > 0:
                         logger.info(f"Generating {ai_total} AI questions in category: {category_name}")
 
@@ -874,6 +876,9 @@ async def post_trivia_questions() -> None:
             except Exception as exc:
                 logger.error("Unexpected error posting to channel %s: %s", channel_id, exc, exc_info=True)
 
+        # Games are independent and generation is LLM/API-bound, so overlap them
+        await asyncio.gather(*(post_game(game_info) for game_info in to_post))
+
         await client.close()
         await close_redis()
 
@@ -18,11 +18,14 @@ class JSONSink:
     def __init__(self, log_dir: Optional[str] = None, log_file_name: Optional[str] = None) -> None:
         """
         Initialize a JSONSink that writes log entries to a file in a logs/ directory.
-        By default, logs are written to <project_root>/logs/YYYY-MM-DD.jsonl
+        By default, logs are written to <project_root>/logs/YYYY-MM-DD.jsonl, or to
+        the LOG_DIR environment variable's directory if set.
         Optionally, a custom log_file_name can be provided (e.g., 'test-YYYY-MM-DD.jsonl').
         """
         if log_dir is None:
-            # Always use project root logs/ directory
+            log_dir = os.getenv("LOG_DIR")
+        if log_dir is None:
+            # Default to the project root logs/ directory
             project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '../../'))
             log_dir = os.path.join(project_root, 'logs')
         self.log_dir = os.path.abspath(log_dir)
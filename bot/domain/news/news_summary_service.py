@@ -3,10 +3,23 @@ news_summary_service.py
 Service for AI-powered news article ranking and summarization.
 """
 
-from typing import List, Dict, Any
+from collections import Counter, OrderedDict, defaultdict
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+import asyncio
+import contextlib
+import hashlib
+import os
 import re
+import time
+
+import orjson
+import tiktoken
 
 from bot.api.openai.chat_completions_client import ChatCompletionsClient
+from bot.app.app_state import get_state_value
+from bot.api.openai.embeddings_client import EmbeddingsClient, cosine_similarity
 from bot.app.utils.logger import get_logger
 
 logger = get_logger()
@@ -24,14 +37,187 @@ MAX_TOP_ARTICLES_LIMIT = 50
 MIN_CLUSTER_LIMIT = 3
 MAX_CLUSTER_LIMIT = 20
 
+# Article ranking: "embedding" (one batched embeddings call + local scoring) or "llm"
+RANKING_STRATEGY = os.getenv("NEWS_RANKING_STRATEGY", "embedding")
+RANKING_CENTRALITY_WEIGHT = 0.7
+RANKING_RECENCY_WEIGHT = 0.3
+
+# Share of new headline terms missing from the posted story below which it is clearly a
+# repeat. There is no matching "clearly an update" cut-off: other outlets reword the
+# same story with mostly new terms, so anything above this goes to the LLM.
+UPDATE_NOVELTY_LOW = 0.1
+
+# Titles whose 64-bit SimHashes differ in at most this many bits are near-duplicates
+NEAR_DUPLICATE_MAX_BITS = 3
+# Shorter titles ("Live updates", "Untitled") are too generic to identify a story,
+# so only their URLs are compared
+NEAR_DUPLICATE_MIN_TITLE_WORDS = 5
+UNTITLED = "Untitled"
+
+# Prompt token budgets (descriptions are trimmed to fit, titles are always kept)
+RANK_PROMPT_TOKEN_BUDGET = 4000
+RANK_OUTPUT_TOKENS_PER_ARTICLE = 8  # Reply is just "12," per ranked article
+STORY_PROMPT_TOKEN_BUDGET = 1000
+_CHARS_PER_TOKEN = 4  # Estimate used when the tokenizer cannot be loaded
+
+# Cap on in-flight LLM requests across every summary being generated concurrently
+LLM_MAX_CONCURRENCY = int(os.getenv("LLM_MAX_CONCURRENCY", "10"))
+_LLM_SEMAPHORE = asyncio.Semaphore(LLM_MAX_CONCURRENCY)
+
+# In-process cache of LLM replies so repeated prompts skip the API; replies are only
+# reused for an hour, since the same articles can warrant a fresh take later in the day
+LLM_RESPONSE_CACHE_SIZE = 1024
+LLM_RESPONSE_CACHE_TTL_SECONDS = 3600
+# prompt key -> (stored_at, reply)
+_LLM_RESPONSE_CACHE: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+
+# Precompiled patterns for parsing LLM responses
+_DIGITS_RE = re.compile(r'\d+')
+_JSON_ARRAY_RE = re.compile(r'\[[\d,\s]*\]')
+_LABELED_LINE_RE = re.compile(r'(TITLE|SUMMARY):\s*(.+)')
+_WORD_RE = re.compile(r'\w+')
+_TERM_RE = re.compile(r'[a-z0-9]{4,}')
+
+# Shared LLM and embeddings clients, created on first use
+_LLM: Optional[ChatCompletionsClient] = None
+_EMBEDDINGS: Optional[EmbeddingsClient] = None
+
+# Tokenizer, loaded on first use (None if it could not be loaded)
+_ENCODING: Optional[tiktoken.Encoding] = None
+_ENCODING_LOADED = False
+
+
+def _llm() -> ChatCompletionsClient:
+    """Return the module's shared gpt-4o-mini client."""
+    global _LLM
+    if _LLM is None:
+        _LLM = ChatCompletionsClient.factory("gpt-4o-mini")
+    return _LLM
+
+
+def _embeddings() -> EmbeddingsClient:
+    """Return the module's shared embeddings client."""
+    global _EMBEDDINGS
+    if _EMBEDDINGS is None:
+        _EMBEDDINGS = EmbeddingsClient.factory()
+    return _EMBEDDINGS
+
+
+async def _chat(messages: List[Dict[str, Any]], max_tokens: Optional[int] = None) -> str:
+    """
+    Send messages to the shared client and return the reply.
+
+    Transient API errors (rate limits, connection errors, 5xx) are retried with
+    backoff by the OpenAI SDK itself, honoring Retry-After; errors that survive its
+    retries are raised so each caller's own fallback runs.
+
+    Non-empty replies are cached in-process (LRU with a TTL, keyed by model, token cap
+    and messages), so a prompt already answered recently costs nothing.
+    """
+    key = hashlib.blake2b(
+        orjson.dumps([_llm().model, max_tokens, messages], option=orjson.OPT_SORT_KEYS),
+        digest_size=16
+    ).hexdigest()
+
+    cached = _LLM_RESPONSE_CACHE.get(key)
+    if cached is not None:
+        stored_at, reply = cached
+        if time.monotonic() - stored_at <= LLM_RESPONSE_CACHE_TTL_SECONDS:
+            _LLM_RESPONSE_CACHE.move_to_end(key)
+            return reply
+        del _LLM_RESPONSE_CACHE[key]
+
+    async with _LLM_SEMAPHORE:
+        response = await _llm().chat(messages, raise_errors=True, max_tokens=max_tokens)
+
+    # An empty reply is a failed answer, not one worth repeating
+    if response:
+        _LLM_RESPONSE_CACHE[key] = (time.monotonic(), response)
+        if len(_LLM_RESPONSE_CACHE) > LLM_RESPONSE_CACHE_SIZE:
+            _LLM_RESPONSE_CACHE.popitem(last=False)
+    return response
+
+
+async def _stream_until(
+    messages: List[Dict[str, Any]],
+    is_complete: Callable[[str], bool]
+) -> str:
+    """
+    Stream a reply and stop reading as soon as is_complete(text so far) is True.
+
+    Used where the parser only needs a prefix of the reply (a TITLE/SUMMARY pair, a
+    JSON array), so trailing tokens the model adds are never waited for. Like chat(),
+    failures still yield text (possibly partial or empty) so callers can fall back.
+    """
+    response = ""
+    try:
+        # The SDK retries the request itself before any text arrives
+        async with _LLM_SEMAPHORE, contextlib.aclosing(_llm().chat_stream(messages)) as chunks:
+            async for chunk in chunks:
+                response += chunk
+                if is_complete(response):
+                    break
+    except Exception as e:
+        # A partial reply is still worth parsing
+        logger.error(f"Error streaming LLM response: {e}")
+    return response
+
+
+def _encoding() -> Optional[tiktoken.Encoding]:
+    """Return the gpt-4o-mini tokenizer, or None if its BPE file is unavailable."""
+    global _ENCODING, _ENCODING_LOADED
+    if not _ENCODING_LOADED:
+        _ENCODING_LOADED = True
+        try:
+            _ENCODING = tiktoken.encoding_for_model("gpt-4o-mini")
+        except Exception as e:
+            logger.warning(f"Tokenizer unavailable, estimating prompt tokens from length: {e}")
+    return _ENCODING
+
+
+def _count_tokens(text: str) -> int:
+    """Count (or estimate) the tokens in text."""
+    encoding = _encoding()
+    if encoding is None:
+        return -(-len(text) // _CHARS_PER_TOKEN)
+    return len(encoding.encode(text))
+
+
+def _truncate_tokens(text: str, max_tokens: int) -> str:
+    """Trim text to at most max_tokens tokens."""
+    encoding = _encoding()
+    if encoding is None:
+        return text[:max_tokens * _CHARS_PER_TOKEN]
+    tokens = encoding.encode(text)
+    return text if len(tokens) <= max_tokens else encoding.decode(tokens[:max_tokens])
+
+
+def _fit_to_token_budget(texts: List[str], budget: int) -> List[str]:
+    """
+    Trim texts so that together they fit in budget tokens.
+
+    Texts shorter than an even share are kept whole and their unused share is
+    handed to the longer ones, so few articles get more context than many.
+    """
+    counts = [_count_tokens(t) for t in texts]
+    fitted = list(texts)
+    remaining = max(budget, 0)
+    pending = len(texts)
+    for i in sorted(range(len(texts)), key=lambda i: counts[i]):
+        share = remaining // pending
+        if counts[i] > share:
+            fitted[i] = _truncate_tokens(texts[i], share)
+            counts[i] = share
+        remaining -= counts[i]
+        pending -= 1
+    return fitted
+
 
 def get_channel_article_limits(guild_id: int, channel_id: int) -> Dict[str, int]:
     """
     Retrieve article processing limits for a specific channel.
     Returns defaults if no custom limits configured.
     """
-    from bot.app.app_state import get_state_value
-
     guild_id_str = str(guild_id)
     all_limits = get_state_value("channel_article_limits", guild_id_str) or {}
     channel_limits = all_limits.get(str(channel_id), {})
@@ -52,116 +238,222 @@ def validate_limit_value(value: int, min_val: int, max_val: int, name: str) -> N
         raise ValueError(f"{name} must be between {min_val} and {max_val}, got {value}")
 
 
-async def filter_articles_by_instructions(
-    articles: List[Dict[str, Any]],
-    filter_instructions_map: Dict[str, str]
-) -> List[Dict[str, Any]]:
+def _normalize_articles(articles: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
     """
-    Filter articles based on feed-specific instructions.
-
-    Args:
-        articles: All articles with feed_name field
-        filter_instructions_map: {feed_name: filter_instructions}
+    Fill in the fields used for prompts and links once per article.
 
-    Returns:
-        Filtered article list
+    Downstream helpers index title/description/link/source directly instead of
+    repeating .get() fallbacks for every prompt they build.
     """
-    if not filter_instructions_map:
-        return articles
+    return [
+        {
+            **a,
+            "title": a.get("title") or UNTITLED,
+            "description": a.get("description") or "",
+            "link": a.get("link") or "",
+            "source": a.get("source") or "Unknown",
+        }
+        for a in articles
+    ]
+
 
+def _canonical_url(url: str) -> str:
+    """Lowercase scheme/host and drop utm_* tracking params and fragments."""
     try:
-        # Group articles by feed_name
-        articles_by_feed = {}
-        for article in articles:
-            feed_name = article.get('feed_name', 'Unknown')
-            if feed_name not in articles_by_feed:
-                articles_by_feed[feed_name] = []
-            articles_by_feed[feed_name].append(article)
+        parts = urlsplit(url.strip())
+    except ValueError:
+        return url
+    query = urlencode([
+        (key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not key.lower().startswith("utm_")
+    ])
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), parts.path, query, ""))
 
-        filtered_articles = []
 
-        # Process each feed
-        for feed_name, feed_articles in articles_by_feed.items():
-            filter_instr = filter_instructions_map.get(feed_name)
+def _title_simhash(tokens: List[str]) -> int:
+    """64-bit SimHash over word-bigram shingles of a title's lowercased words."""
+    shingles = [" ".join(pair) for pair in zip(tokens, tokens[1:])] or tokens
+    weights = [0] * 64
+    for shingle in shingles:
+        h = int.from_bytes(hashlib.blake2b(shingle.encode(), digest_size=8).digest(), "big")
+        for bit in range(64):
+            weights[bit] += 1 if h >> bit & 1 else -1
+    return sum(1 << bit for bit in range(64) if weights[bit] > 0)
 
-            if not filter_instr:
-                # No filter for this feed, keep all articles
-                filtered_articles.extend(feed_articles)
+
+def _dedup_articles(articles: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Drop repeated articles before any LLM call, keeping the first occurrence.
+
+    An article is a duplicate if its canonical URL was already seen or its title
+    SimHash is within NEAR_DUPLICATE_MAX_BITS of a kept title (syndicated copies).
+    Titles are only compared when they have at least NEAR_DUPLICATE_MIN_TITLE_WORDS
+    words and are not the UNTITLED placeholder.
+    """
+    seen_urls = set()
+    kept_hashes: List[int] = []
+    unique = []
+    for a in articles:
+        url = _canonical_url(a["link"]) if a["link"] else ""
+        if url and url in seen_urls:
+            continue
+
+        tokens = _WORD_RE.findall(a["title"].lower())
+        if a["title"] != UNTITLED and len(tokens) >= NEAR_DUPLICATE_MIN_TITLE_WORDS:
+            title_hash = _title_simhash(tokens)
+            if any(bin(title_hash ^ h).count("1") <= NEAR_DUPLICATE_MAX_BITS for h in kept_hashes):
                 continue
+            kept_hashes.append(title_hash)
+
+        if url:
+            seen_urls.add(url)
+        unique.append(a)
+    return unique
+
+
+def _extract_json_object(text: str) -> Optional[str]:
+    """
+    Return the first balanced {...} object in text, or None.
+
+    Tracks nesting depth and skips braces inside JSON strings, so nested objects
+    and braces in string values (e.g. a "reason") don't cut the object short.
+    """
+    start = text.find("{")
+    if start == -1:
+        return None
+
+    depth = 0
+    in_string = False
+    escaped = False
+    for i in range(start, len(text)):
+        char = text[i]
+        if in_string:
+            if escaped:
+                escaped = False
+            elif char == "\\":
+                escaped = True
+            elif char == '"':
+                in_string = False
+        elif char == '"':
+            in_string = True
+        elif char == "{":
+            depth += 1
+        elif char == "}":
+            depth -= 1
+            if depth == 0:
+                return text[start:i + 1]
+    return None
+
+
+def _numbered_article_list(articles: List[Dict[str, Any]], description_chars: int) -> str:
+    """Format articles as "N. title - description" lines for a prompt."""
+    return "\n".join(
+        f"{i}. {a['title']} - {a['description'][:description_chars]}"
+        for i, a in enumerate(articles, 1)
+    )
+
 
-            # Prepare article list for LLM
-            article_list = [
-                f"{i+1}. {a.get('title', 'Untitled')} - {a.get('description', '')[:200]}"
-                for i, a in enumerate(feed_articles)
-            ]
+async def _filter_feed_articles(
+    feed_name: str,
+    feed_articles: List[Dict[str, Any]],
+    filter_instr: str
+) -> List[Dict[str, Any]]:
+    """
+    Filter one feed's articles against its instructions.
+
+    Returns:
+        The articles to keep (all of them if the LLM call or its response fails)
+    """
+    try:
+        # Prepare article list for LLM
+        article_list = _numbered_article_list(feed_articles, 200)
 
-            prompt = f"""Filter these articles based on: "{filter_instr}"
+        prompt = f"""Filter these articles based on: "{filter_instr}"
 
 Articles:
-{chr(10).join(article_list)}
+{article_list}
 
 Return ONLY a JSON array of article numbers to KEEP (articles that match the filter criteria).
 Example: [1, 3, 5, 8]
 
 If none match, return: []"""
 
-            llm = ChatCompletionsClient.factory("gpt-4o-mini")
-            response = await llm.chat([
-                {"role": "system", "content": "You are a news filter. Return only the JSON array."},
-                {"role": "user", "content": prompt}
-            ])
-
-            # Parse JSON response
-            import json
-
-            json_match = re.search(r'\[[\d,\s]*\]', response)
-            if not json_match:
-                logger.warning(f"Could not parse filter response for {feed_name}, keeping all articles")
-                filtered_articles.extend(feed_articles)
-                continue
+        # Only the JSON array matters, so stop reading once it closes
+        response = await _stream_until([
+            {"role": "system", "content": "You are a news filter. Return only the JSON array."},
+            {"role": "user", "content": prompt}
+        ], lambda text: _JSON_ARRAY_RE.search(text) is not None)
 
-            keep_indices = json.loads(json_match.group())
+        # Parse JSON response
+        json_match = _JSON_ARRAY_RE.search(response)
+        if not json_match:
+            logger.warning(f"Could not parse filter response for {feed_name}, keeping all articles")
+            return feed_articles
 
-            # Keep matching articles
-            for idx in keep_indices:
-                if 0 < idx <= len(feed_articles):
-                    filtered_articles.append(feed_articles[idx - 1])
+        keep_indices = orjson.loads(json_match.group())
 
-            logger.info(f"Filtered {feed_name}: {len(keep_indices)}/{len(feed_articles)} articles kept")
+        # Keep matching articles
+        kept = [
+            feed_articles[idx - 1]
+            for idx in keep_indices
+            if 0 < idx <= len(feed_articles)
+        ]
 
-        logger.info(f"Total filtered: {len(filtered_articles)}/{len(articles)} articles")
-        return filtered_articles
+        logger.info(f"Filtered {feed_name}: {len(keep_indices)}/{len(feed_articles)} articles kept")
+        return kept
 
     except Exception as e:
-        logger.error(f"Error filtering articles: {e}")
-        # Fallback: return all articles
-        return articles
+        logger.error(f"Error filtering articles for {feed_name}: {e}")
+        # Fallback: keep all of this feed's articles
+        return feed_articles
 
 
-async def rank_articles_by_importance(articles: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+async def filter_articles_by_instructions(
+    articles: List[Dict[str, Any]],
+    filter_instructions_map: Dict[str, str]
+) -> List[Dict[str, Any]]:
     """
-    Use LLM to rank articles by importance and newsworthiness.
+    Filter articles based on feed-specific instructions.
+
+    Feeds are filtered concurrently; a feed whose filter call fails keeps all of its articles.
 
     Args:
-        articles: List of article dictionaries with title, description, link, etc.
+        articles: All articles with feed_name field
+        filter_instructions_map: {feed_name: filter_instructions}
 
     Returns:
-        List of articles sorted by importance (highest first)
+        Filtered article list
     """
-    if not articles:
-        return []
-
-    if len(articles) == 1:
+    if not filter_instructions_map:
         return articles
 
-    try:
-        # Prepare article list for LLM (limit description length)
-        article_summaries = [
-            f"{i+1}. {a.get('title', 'Untitled')} - {a.get('description', '')[:200]}"
-            for i, a in enumerate(articles)
-        ]
+    # Group articles by feed_name
+    articles_by_feed: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+    for article in articles:
+        articles_by_feed[article.get('feed_name', 'Unknown')].append(article)
+
+    # Process all filtered feeds in parallel
+    filtered_feeds = [name for name in articles_by_feed if filter_instructions_map.get(name)]
+    results = await asyncio.gather(*[
+        _filter_feed_articles(name, articles_by_feed[name], filter_instructions_map[name])
+        for name in filtered_feeds
+    ])
+    kept_by_feed = dict(zip(filtered_feeds, results))
+
+    # Feeds without a filter keep all their articles; feed order is preserved
+    filtered_articles = [
+        article
+        for name, feed_articles in articles_by_feed.items()
+        for article in kept_by_feed.get(name, feed_articles)
+    ]
+
+    logger.info(f"Total filtered: {len(filtered_articles)}/{len(articles)} articles")
+    return filtered_articles
+
 
-        prompt = f"""You are a news editor. Rank these articles by importance and newsworthiness.
+_RANK_SYSTEM_PROMPT = "You are a professional news editor who ranks articles by importance."
+
+_RANK_PROMPT_HEADER = """You are a news editor. Rank these articles by importance and newsworthiness.
 
 Consider:
 - Timeliness and relevance
@@ -170,17 +462,78 @@ Consider:
 - Source credibility
 
 Articles:
-{chr(10).join(article_summaries)}
+"""
+
+_RANK_PROMPT_FOOTER = """
 
-Return ONLY a comma-separated list of article numbers in order of importance (most important first).
+Return ONLY a comma-separated list of the {count} most important article numbers, most important first.
 For example: "3,1,7,2,5"
 Do not include any other text or explanation."""
 
-        llm = ChatCompletionsClient.factory("gpt-4o-mini")
-        response = await llm.chat([
-            {"role": "system", "content": "You are a professional news editor who ranks articles by importance."},
+
+def _build_rank_prompt(
+    articles: List[Dict[str, Any]],
+    system_prompt: str,
+    header: str,
+    footer: str
+) -> str:
+    """Number the articles between header and footer, fitting descriptions to RANK_PROMPT_TOKEN_BUDGET."""
+    # Measure the fixed parts once; descriptions share whatever budget is left
+    title_prefixes = [f"{i+1}. {a['title']} - " for i, a in enumerate(articles)]
+    scaffold_tokens = (
+        _count_tokens(system_prompt + header + footer)
+        + sum(_count_tokens(prefix) + 1 for prefix in title_prefixes)
+    )
+    descriptions = _fit_to_token_budget(
+        [a['description'] for a in articles],
+        RANK_PROMPT_TOKEN_BUDGET - scaffold_tokens
+    )
+    return "".join((
+        header,
+        "\n".join(prefix + d for prefix, d in zip(title_prefixes, descriptions)),
+        footer,
+    ))
+
+
+async def rank_articles_by_importance(
+    articles: List[Dict[str, Any]],
+    top_n: Optional[int] = None
+) -> List[Dict[str, Any]]:
+    """
+    Use LLM to rank articles by importance and newsworthiness.
+
+    Articles are listed newest first, so the model starts from a sensible order and
+    only has to name the top_n it would promote; the rest keep that recency order.
+
+    Args:
+        articles: List of article dictionaries with title, description, link, etc.
+        top_n: How many articles the model should rank (default: all)
+
+    Returns:
+        List of articles sorted by importance (highest first)
+    """
+    if not articles:
+        return []
+
+    if len(articles) == 1:
+        return articles
+
+    # Undated articles sort last
+    articles = sorted(articles, key=lambda a: _article_timestamp(a) or 0.0, reverse=True)
+    count = min(top_n or len(articles), len(articles))
+
+    try:
+        prompt = _build_rank_prompt(
+            articles,
+            _RANK_SYSTEM_PROMPT,
+            _RANK_PROMPT_HEADER,
+            _RANK_PROMPT_FOOTER.format(count=count)
+        )
+
+        response = await _chat([
+            {"role": "system", "content": _RANK_SYSTEM_PROMPT},
             {"role": "user", "content": prompt}
-        ])
+        ], max_tokens=count * RANK_OUTPUT_TOKENS_PER_ARTICLE)
 
         # Parse the response
         ranking = parse_ranking_response(response)
@@ -198,6 +551,96 @@ Do not include any other text or explanation."""
         return articles
 
 
+def _article_timestamp(article: Dict[str, Any]) -> Optional[float]:
+    """Best-effort POSIX timestamp from published/collected_at (naive values are UTC)."""
+    for key in ("published", "collected_at"):
+        value = article.get(key)
+        if not value:
+            continue
+        try:
+            parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+        except (TypeError, ValueError):
+            continue
+        if parsed.tzinfo is None:
+            parsed = parsed.replace(tzinfo=timezone.utc)
+        return parsed.timestamp()
+    return None
+
+
+def _recency_scores(articles: List[Dict[str, Any]]) -> List[float]:
+    """Scale article timestamps to [0, 1] within the batch (undated articles score 0)."""
+    timestamps = [_article_timestamp(a) for a in articles]
+    known = [t for t in timestamps if t is not None]
+    if not known:
+        return [0.0] * len(articles)
+
+    oldest, newest = min(known), max(known)
+    span = newest - oldest
+    return [
+        0.0 if t is None else (1.0 if not span else (t - oldest) / span)
+        for t in timestamps
+    ]
+
+
+async def rank_articles_by_embedding(articles: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Rank articles by embedding centrality and recency.
+
+    A single batched embeddings call replaces the ranking prompt. Articles close to
+    the centroid of the batch are the stories most feeds are covering, which is the
+    signal the LLM ranker mostly relied on.
+
+    Args:
+        articles: List of normalized article dictionaries
+
+    Returns:
+        List of articles sorted by score (highest first)
+
+    Raises:
+        Exception: If the embeddings request fails (caller falls back)
+    """
+    if len(articles) <= 1:
+        return articles
+
+    async with _LLM_SEMAPHORE:
+        vectors = await _embeddings().embed([f"{a['title']}. {a['description'][:300]}" for a in articles])
+
+    centroid = [sum(column) / len(vectors) for column in zip(*vectors)]
+    recency = _recency_scores(articles)
+
+    scores = [
+        RANKING_CENTRALITY_WEIGHT * cosine_similarity(vector, centroid)
+        + RANKING_RECENCY_WEIGHT * recency[i]
+        for i, vector in enumerate(vectors)
+    ]
+    order = sorted(range(len(articles)), key=lambda i: scores[i], reverse=True)
+
+    logger.info(f"Ranked {len(articles)} articles using embeddings")
+    return [articles[i] for i in order]
+
+
+async def rank_articles(
+    articles: List[Dict[str, Any]],
+    top_n: Optional[int] = None
+) -> List[Dict[str, Any]]:
+    """
+    Rank articles using the configured strategy (NEWS_RANKING_STRATEGY).
+
+    The embedding ranker falls back to the LLM ranker if the embeddings call fails.
+    top_n is how many leading articles the caller will use (the LLM ranker only
+    orders that many).
+    """
+    if RANKING_STRATEGY == "llm":
+        return await rank_articles_by_importance(articles, top_n)
+
+    try:
+        return await rank_articles_by_embedding(articles)
+    except Exception as e:
+        logger.error(f"Error ranking articles with embeddings: {e}")
+        logger.info("Falling back to LLM ranking")
+        return await rank_articles_by_importance(articles, top_n)
+
+
 def parse_ranking_response(response: str) -> List[int]:
     """
     Parse the LLM ranking response to extract article numbers.
@@ -209,7 +652,7 @@ def parse_ranking_response(response: str) -> List[int]:
         List of article indices (0-based)
     """
     # Extract numbers from response
-    numbers = re.findall(r'\d+', response)
+    numbers = _DIGITS_RE.findall(response)
 
     if not numbers:
         raise ValueError(f"Could not parse ranking from response: {response}")
@@ -232,16 +675,16 @@ def reorder_articles(articles: List[Dict[str, Any]], ranking: List[int]) -> List
         Reordered article list
     """
     try:
+        # Single pass: bounds check and dedup repeated indices together
+        seen = set()
         reordered = []
         for idx in ranking:
-            if 0 <= idx < len(articles):
+            if 0 <= idx < len(articles) and idx not in seen:
+                seen.add(idx)
                 reordered.append(articles[idx])
 
-        # Add any articles that weren't in the ranking (shouldn't happen, but safety)
-        ranked_indices = set(ranking)
-        for i, article in enumerate(articles):
-            if i not in ranked_indices:
-                reordered.append(article)
+        # Add articles the ranking left out (e.g. beyond the requested top N), in original order
+        reordered.extend(a for i, a in enumerate(articles) if i not in seen)
 
         return reordered
     except Exception as e:
@@ -249,6 +692,26 @@ def reorder_articles(articles: List[Dict[str, Any]], ranking: List[int]) -> List
         return articles
 
 
+def _clusters_from_mapping(
+    clusters_dict: Dict[str, List[int]],
+    articles: List[Dict[str, Any]]
+) -> List[Dict[str, Any]]:
+    """Convert an LLM {cluster_id: [article numbers]} mapping into cluster dicts (bad numbers are skipped)."""
+    clusters = []
+    for cluster_id, indices in clusters_dict.items():
+        cluster_articles = [
+            articles[idx - 1]
+            for idx in indices
+            if isinstance(idx, int) and 0 < idx <= len(articles)
+        ]
+        if cluster_articles:
+            clusters.append({
+                "articles": cluster_articles,
+                "theme": cluster_id
+            })
+    return clusters
+
+
 async def cluster_articles_by_story(
     articles: List[Dict[str, Any]],
     max_clusters: int = 8
@@ -271,52 +734,30 @@ async def cluster_articles_by_story(
 
     try:
         # Prepare article list for LLM
-        article_list = [
-            f"{i+1}. {a.get('title', 'Untitled')} - {a.get('description', '')[:100]}"
-            for i, a in enumerate(articles)
-        ]
+        article_list = _numbered_article_list(articles, 100)
 
         prompt = f"""Group these articles into stories covering the same event or topic.
 Articles about the same core story should be grouped together, even with different angles.
 
 Articles:
-{chr(10).join(article_list)}
+{article_list}
 
 Return JSON mapping cluster IDs to article numbers:
 {{"cluster_1": [1, 5, 8], "cluster_2": [2, 4], "cluster_3": [3], ...}}
 
 Aim for 5-8 total clusters. Single-article clusters are fine."""
 
-        llm = ChatCompletionsClient.factory("gpt-4o-mini")
-        response = await llm.chat([
+        response = await _chat([
             {"role": "system", "content": "You are a news editor grouping similar articles."},
             {"role": "user", "content": prompt}
         ])
 
         # Parse JSON response
-        import json
-
-        json_match = re.search(r'\{[^}]+\}', response, re.DOTALL)
-        if not json_match:
+        json_text = _extract_json_object(response)
+        if json_text is None:
             raise ValueError("No JSON found")
 
-        clusters_dict = json.loads(json_match.group())
-
-        # Convert to cluster list
-        clusters = []
-        for cluster_id, indices in clusters_dict.items():
-            cluster_articles = []
-            for idx in indices:
-                if 0 < idx <= len(articles):
-                    cluster_articles.append(articles[idx - 1])
-
-            if cluster_articles:
-                clusters.append({
-                    "articles": cluster_articles,
-                    "theme": cluster_id
-                })
-
-        clusters = clusters[:max_clusters]
+        clusters = _clusters_from_mapping(orjson.loads(json_text), articles)[:max_clusters]
         logger.info(f"Clustered {len(articles)} articles into {len(clusters)} stories (max: {max_clusters})")
         return clusters
 
@@ -327,37 +768,116 @@ Aim for 5-8 total clusters. Single-article clusters are fine."""
                 for i, a in enumerate(articles[:max_clusters])]
 
 
-async def generate_preliminary_title(articles: List[Dict[str, Any]]) -> str:
+_RANK_AND_CLUSTER_SYSTEM_PROMPT = "You are a professional news editor who ranks articles and groups them into stories."
+
+_RANK_AND_CLUSTER_PROMPT_HEADER = """You are a news editor. Rank these articles by importance and newsworthiness, then group the most important ones into stories.
+
+Consider:
+- Timeliness and relevance
+- Impact on readers
+- Uniqueness of information
+- Source credibility
+
+Articles:
+"""
+
+_RANK_AND_CLUSTER_PROMPT_FOOTER = """
+
+Return ONLY JSON with two keys:
+- "ranking": the {count} most important article numbers, most important first
+- "clusters": those same articles grouped into stories, mapping cluster IDs to article numbers
+
+Example: {{"ranking": [3, 1, 7, 2], "clusters": {{"cluster_1": [3, 7], "cluster_2": [1], "cluster_3": [2]}}}}
+
+Articles about the same core story should be grouped together, even with different angles.
+Aim for 5-8 total clusters. Single-article clusters are fine."""
+
+
+async def _rank_and_cluster_with_llm(
+    articles: List[Dict[str, Any]],
+    top_n: int,
+    max_clusters: int
+) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
     """
-    Generate a quick preliminary title for a story cluster.
-    Used for duplicate detection before full summary generation.
+    Rank articles and cluster the top ones in a single LLM call.
+
+    Raises:
+        Exception: If the call fails or the response cannot be parsed (caller falls back)
     """
-    if not articles:
-        return "Untitled Story"
+    # Same recency pre-sort as rank_articles_by_importance
+    articles = sorted(articles, key=lambda a: _article_timestamp(a) or 0.0, reverse=True)
+    count = min(top_n, len(articles))
 
-    if len(articles) == 1:
-        return articles[0].get("title", "Untitled Story")
+    prompt = _build_rank_prompt(
+        articles,
+        _RANK_AND_CLUSTER_SYSTEM_PROMPT,
+        _RANK_AND_CLUSTER_PROMPT_HEADER,
+        _RANK_AND_CLUSTER_PROMPT_FOOTER.format(count=count)
+    )
+    response = await _chat([
+        {"role": "system", "content": _RANK_AND_CLUSTER_SYSTEM_PROMPT},
+        {"role": "user", "content": prompt}
+    ], max_tokens=2 * count * RANK_OUTPUT_TOKENS_PER_ARTICLE)
 
-    try:
-        # Quick prompt to get just the title
-        article_titles = [a.get("title", "Untitled") for a in articles]
-        prompt = f"""These articles cover the same story. Generate ONE unified title (max 80 chars):
+    json_text = _extract_json_object(response)
+    if json_text is None:
+        raise ValueError("No JSON found")
+    parsed = orjson.loads(json_text)
 
-{chr(10).join(f"{i+1}. {t}" for i, t in enumerate(article_titles))}
+    ranking = [idx - 1 for idx in parsed["ranking"] if isinstance(idx, int)]
+    top_articles = reorder_articles(articles, ranking)[:top_n]
 
-Return ONLY the title, nothing else."""
+    # Only keep clustered articles that made the top N
+    top_ids = {id(a) for a in top_articles}
+    clusters = []
+    for cluster in _clusters_from_mapping(parsed["clusters"], articles):
+        cluster["articles"] = [a for a in cluster["articles"] if id(a) in top_ids]
+        if cluster["articles"]:
+            clusters.append(cluster)
+    if not clusters:
+        raise ValueError("No clusters found")
 
-        llm = ChatCompletionsClient.factory("gpt-4o-mini")
-        response = await llm.chat([
-            {"role": "system", "content": "You are a news editor. Return only the title."},
-            {"role": "user", "content": prompt}
-        ])
+    return top_articles, clusters[:max_clusters]
 
-        return response.strip()[:80]
 
-    except Exception as e:
-        logger.error(f"Error generating preliminary title: {e}")
-        return articles[0].get("title", "Untitled Story")
+async def rank_and_cluster_articles(
+    articles: List[Dict[str, Any]],
+    top_n: int,
+    max_clusters: int
+) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+    """
+    Select the top N articles and group them into story clusters.
+
+    With the "llm" ranking strategy both steps share one LLM call, falling back to
+    separate ranking and clustering calls if it fails. The embedding strategy ranks
+    locally, so clustering is its only LLM call anyway.
+
+    Args:
+        articles: Normalized articles to choose from
+        top_n: Max articles to keep for clustering
+        max_clusters: Max story clusters to return
+
+    Returns:
+        Tuple of (top articles, story clusters)
+    """
+    if RANKING_STRATEGY == "llm" and len(articles) > 1:
+        try:
+            top_articles, clusters = await _rank_and_cluster_with_llm(articles, top_n, max_clusters)
+            logger.info(
+                f"Ranked {len(articles)} articles and clustered top {len(top_articles)} "
+                f"into {len(clusters)} stories in one call"
+            )
+            return top_articles, clusters
+        except Exception as e:
+            logger.error(f"Error ranking and clustering in one call: {e}")
+            logger.info("Falling back to separate ranking and clustering")
+
+    ranked_articles = await rank_articles(articles, top_n=top_n)
+    top_articles = ranked_articles[:top_n]
+    logger.info(f"Selected top {len(top_articles)} articles from {len(ranked_articles)} ranked articles")
+
+    story_clusters = await cluster_articles_by_story(top_articles, max_clusters=max_clusters)
+    return top_articles, story_clusters
 
 
 async def check_story_similarity(
@@ -394,20 +914,18 @@ Return JSON: {{"is_similar": true/false, "similar_to_index": 1-based number or n
 
 If similar, return the index of the most similar posted story."""
 
-        llm = ChatCompletionsClient.factory("gpt-4o-mini")
-        response = await llm.chat([
+        response = await _chat([
             {"role": "system", "content": "You are a news editor detecting duplicate stories. Return only JSON."},
             {"role": "user", "content": prompt}
         ])
 
         # Parse JSON response
-        import json
-        json_match = re.search(r'\{[^}]+\}', response, re.DOTALL)
-        if not json_match:
+        json_text = _extract_json_object(response)
+        if json_text is None:
             logger.warning("Could not parse similarity check response")
             return False, None
 
-        result = json.loads(json_match.group())
+        result = orjson.loads(json_text)
 
         if result.get("is_similar"):
             idx = result.get("similar_to_index")
@@ -421,6 +939,29 @@ If similar, return the index of the most similar posted story."""
         return False, None
 
 
+def _quick_novelty(
+    new_articles: List[Dict[str, Any]],
+    historical_story: Dict[str, Any]
+) -> Optional[bool]:
+    """
+    Cheap term-overlap check between new headlines and a posted story.
+
+    Returns:
+        False if almost no headline terms are new (a repeat), otherwise None
+        (needs the LLM; a reworded repeat can look as novel as a real update)
+    """
+    new_terms = set(_TERM_RE.findall(" ".join(a['title'] for a in new_articles[:3]).lower()))
+    if not new_terms:
+        return None
+
+    old_text = f"{historical_story.get('title', '')} {historical_story.get('summary', '')}"
+    novelty = len(new_terms - set(_TERM_RE.findall(old_text.lower()))) / len(new_terms)
+
+    if novelty < UPDATE_NOVELTY_LOW:
+        return False
+    return None
+
+
 async def check_significant_updates(
     new_articles: List[Dict[str, Any]],
     historical_story: Dict[str, Any]
@@ -428,12 +969,17 @@ async def check_significant_updates(
     """
     Check if new articles contain significant updates compared to historical story.
 
-    Returns True if significant new information is present.
+    Returns True if significant new information is present. Clear repeats are
+    decided by term overlap alone; everything else costs an LLM call.
     """
+    if _quick_novelty(new_articles, historical_story) is False:
+        logger.info("Update check decided by term overlap: repeat")
+        return False
+
     try:
         # Get article summaries
         new_content = "\n".join([
-            f"- {a.get('title', '')}: {a.get('description', '')[:200]}"
+            f"- {a['title']}: {a['description'][:200]}"
             for a in new_articles[:3]  # Limit to 3 articles
         ])
 
@@ -453,20 +999,18 @@ Do the NEW articles contain SIGNIFICANT updates or developments?
 
 Return JSON: {{"has_significant_updates": true/false, "reason": "brief explanation"}}"""
 
-        llm = ChatCompletionsClient.factory("gpt-4o-mini")
-        response = await llm.chat([
+        response = await _chat([
             {"role": "system", "content": "You are a news editor evaluating story updates. Return only JSON."},
             {"role": "user", "content": prompt}
         ])
 
         # Parse JSON response
-        import json
-        json_match = re.search(r'\{[^}]+\}', response, re.DOTALL)
-        if not json_match:
+        json_text = _extract_json_object(response)
+        if json_text is None:
             logger.warning("Could not parse update check response")
             return False  # Conservative: don't show if unsure
 
-        result = json.loads(json_match.group())
+        result = orjson.loads(json_text)
         has_updates = result.get("has_significant_updates", False)
 
         if has_updates:
@@ -480,46 +1024,93 @@ Return JSON: {{"has_significant_updates": true/false, "reason": "brief explanati
         return False  # Conservative: don't show if error
 
 
-async def _process_cluster_for_dedup(
-    cluster: Dict[str, Any],
+async def batch_check_story_similarity(
+    new_titles: List[str],
     historical_titles: List[str],
     story_history: List[Dict[str, Any]]
-) -> tuple[Dict[str, Any] | None, str]:
+) -> List[Dict[str, Any] | None]:
     """
-    Process a single cluster for deduplication.
+    Check every new story title against today's history in a single LLM call.
 
     Returns:
-        Tuple of (cluster if should keep or None if should filter, preliminary_title)
+        One entry per new title: the similar story dict, or None if it is unique
     """
-    articles = cluster["articles"]
+    if not new_titles or not historical_titles:
+        return [None] * len(new_titles)
 
-    # Generate preliminary title
-    prelim_title = await generate_preliminary_title(articles)
+    try:
+        new_list = "\n".join(f"{i+1}. {t}" for i, t in enumerate(new_titles))
+        historical_list = "\n".join(f"{i+1}. {t}" for i, t in enumerate(historical_titles))
 
-    # Check similarity
-    is_duplicate, similar_story = await check_story_similarity(
-        prelim_title,
-        articles,
-        historical_titles,
-        story_history
-    )
+        prompt = f"""Compare each NEW story title against TODAY'S posted stories:
 
-    if is_duplicate and similar_story:
-        # Similar story found, check for updates
-        logger.info(f"Story '{prelim_title}' similar to '{similar_story.get('title')}' - checking for updates")
+NEW STORIES:
+{new_list}
 
-        has_updates = await check_significant_updates(articles, similar_story)
+TODAY'S POSTED STORIES:
+{historical_list}
 
-        if has_updates:
-            logger.info(f"Significant updates found - keeping story")
-            return cluster, prelim_title
-        else:
-            logger.info(f"No significant updates - filtering duplicate story")
-            return None, prelim_title
-    else:
+For each NEW story, is it about the same event/topic as any POSTED story?
+- Consider: Same core event, same main subject, covering same news
+- Ignore: Minor wording differences, different sources, different angles
+
+Return JSON mapping every NEW story number to the 1-based number of the most similar POSTED story, or null if none is similar:
+{{"1": 3, "2": null, "3": 1}}"""
+
+        response = await _chat([
+            {"role": "system", "content": "You are a news editor detecting duplicate stories. Return only JSON."},
+            {"role": "user", "content": prompt}
+        ])
+
+        # Parse JSON response
+        json_text = _extract_json_object(response)
+        if json_text is None:
+            logger.warning("Could not parse batch similarity check response")
+            return [None] * len(new_titles)
+
+        result = orjson.loads(json_text)
+
+        similar_stories: List[Dict[str, Any] | None] = []
+        for i in range(len(new_titles)):
+            idx = result.get(str(i + 1))
+            if isinstance(idx, int) and 0 < idx <= len(story_history):
+                similar_stories.append(story_history[idx - 1])
+            else:
+                similar_stories.append(None)
+        return similar_stories
+
+    except Exception as e:
+        logger.error(f"Error checking story similarity: {e}")
+        return [None] * len(new_titles)
+
+
+async def _process_cluster_for_dedup(
+    cluster: Dict[str, Any],
+    prelim_title: str,
+    similar_story: Dict[str, Any] | None
+) -> tuple[Dict[str, Any] | None, str]:
+    """
+    Decide whether to keep a single cluster given its similarity check result.
+
+    Returns:
+        Tuple of (cluster if should keep or None if should filter, preliminary_title)
+    """
+    if not similar_story:
         # Unique story, keep it
         return cluster, prelim_title
 
+    # Similar story found, check for updates
+    logger.info(f"Story '{prelim_title}' similar to '{similar_story.get('title')}' - checking for updates")
+
+    has_updates = await check_significant_updates(cluster["articles"], similar_story)
+
+    if has_updates:
+        logger.info(f"Significant updates found - keeping story")
+        return cluster, prelim_title
+    else:
+        logger.info(f"No significant updates - filtering duplicate story")
+        return None, prelim_title
+
 
 async def filter_duplicate_stories(
     story_clusters: List[Dict[str, Any]],
@@ -527,8 +1118,8 @@ async def filter_duplicate_stories(
 ) -> List[Dict[str, Any]]:
     """
     Filter duplicate stories using hybrid approach:
-    1. Generate preliminary titles for each cluster (parallel)
-    2. Check semantic similarity against today's history (parallel)
+    1. Take each cluster's lead article title as its preliminary title
+    2. Check semantic similarity of all clusters against today's history (one call)
     3. If similar, check for significant updates (parallel)
     4. Keep unique stories and stories with significant updates
 
@@ -541,11 +1132,18 @@ async def filter_duplicate_stories(
     historical_titles = [s["title"] for s in story_history]
     logger.info(f"Checking {len(story_clusters)} new clusters against {len(historical_titles)} historical stories")
 
-    # Process all clusters in parallel
-    import asyncio
-    results = await asyncio.gather(*[
-        _process_cluster_for_dedup(cluster, historical_titles, story_history)
+    # Preliminary title: the lead (highest-ranked) article's headline. It is only
+    # matched against history, so it doesn't need its own LLM call
+    prelim_titles = [
+        cluster["articles"][0]["title"] if cluster["articles"] else "Untitled Story"
         for cluster in story_clusters
+    ]
+    similar_stories = await batch_check_story_similarity(prelim_titles, historical_titles, story_history)
+
+    # Only clusters that matched a posted story need an update check
+    results = await asyncio.gather(*[
+        _process_cluster_for_dedup(cluster, prelim_title, similar_story)
+        for cluster, prelim_title, similar_story in zip(story_clusters, prelim_titles, similar_stories)
     ])
 
     # Filter out None values (duplicate stories without updates)
@@ -555,31 +1153,33 @@ async def filter_duplicate_stories(
     return filtered_clusters
 
 
-async def _generate_single_story_summary(cluster: Dict[str, Any]) -> Dict[str, Any]:
-    """
-    Generate summary for a single story cluster.
+def _summary_line_complete(text: str) -> bool:
+    """True once a streamed TITLE/SUMMARY reply has a finished SUMMARY line."""
+    summary_at = text.find("SUMMARY:")
+    return summary_at != -1 and "\n" in text[summary_at:]
 
-    Args:
-        cluster: Cluster dict with articles
 
-    Returns:
-        Dict with title, summary, links
-    """
+def _build_story_summary_messages(cluster: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Build the TITLE/SUMMARY chat messages for a single story cluster."""
     articles = cluster["articles"]
 
     if len(articles) > 1:
         # Multi-article: synthesize unified story
-        article_details = [
-            f"{i+1}. Title: {a.get('title', 'Untitled')}\n"
-            f"   Source: {a.get('source', 'Unknown')}\n"
-            f"   Description: {a.get('description', '')[:300]}"
-            for i, a in enumerate(articles)
-        ]
+        descriptions = _fit_to_token_budget(
+            [a['description'] for a in articles],
+            STORY_PROMPT_TOKEN_BUDGET
+        )
+        article_details = "\n".join(
+            f"{i+1}. Title: {a['title']}\n"
+            f"   Source: {a['source']}\n"
+            f"   Description: {d}"
+            for i, (a, d) in enumerate(zip(articles, descriptions))
+        )
 
         prompt = f"""Create unified summary for story covered by multiple sources.
 
 Story articles:
-{chr(10).join(article_details)}
+{article_details}
 
 Create:
 1. Neutral, informative story title (max 80 characters)
@@ -594,8 +1194,8 @@ SUMMARY: [Your summary here]"""
         article = articles[0]
         prompt = f"""Refine this story for concise presentation.
 
-Title: {article.get('title', 'Untitled')}
-Description: {article.get('description', '')}
+Title: {article['title']}
+Description: {_truncate_tokens(article['description'], STORY_PROMPT_TOKEN_BUDGET)}
 
 Create:
 1. Refined story title (max 80 characters)
@@ -605,39 +1205,65 @@ Format:
 TITLE: [Your title here]
 SUMMARY: [Your summary here]"""
 
-    # Generate title and summary
-    llm = ChatCompletionsClient.factory("gpt-4o-mini")
-    response = await llm.chat([
+    return [
         {"role": "system", "content": "You are a news editor creating concise summaries."},
         {"role": "user", "content": prompt}
-    ])
+    ]
 
-    # Parse response
-    title_match = re.search(r'TITLE:\s*(.+)', response)
-    summary_match = re.search(r'SUMMARY:\s*(.+)', response)
 
-    title = title_match.group(1).strip() if title_match else articles[0].get('title', 'Breaking News')
-    summary = summary_match.group(1).strip() if summary_match else articles[0].get('description', '')[:100]
-
-    # Collect all source links and deduplicate by URL
+def _story_links(articles: List[Dict[str, Any]]) -> List[Dict[str, str]]:
+    """Collect all source links, deduplicated by URL."""
     seen_urls = set()
     links = []
     for a in articles:
-        url = a.get('link', '')
+        url = a['link']
         if url and url not in seen_urls:
             seen_urls.add(url)
             links.append({
-                "source": a.get('source', 'Unknown'),
+                "source": a['source'],
                 "url": url
             })
+    return links
+
+
+def _parse_story_summary(response: str, cluster: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Parse a TITLE/SUMMARY response into a story summary dict.
+
+    Falls back to the first article's title/description for missing fields, so an
+    empty response (a failed or interrupted stream) still yields a story.
+    """
+    articles = cluster["articles"]
+
+    # One pass over the response; keep the first value seen for each label
+    fields: Dict[str, str] = {}
+    for label, value in _LABELED_LINE_RE.findall(response):
+        fields.setdefault(label, value.strip())
+
+    title = fields.get("TITLE") or articles[0]['title']
+    summary = fields.get("SUMMARY") or articles[0]['description'][:100]
 
     return {
         "title": title,
         "summary": summary,
-        "links": links
+        "links": _story_links(articles)
     }
 
 
+async def _generate_single_story_summary(cluster: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Generate summary for a single story cluster.
+
+    Args:
+        cluster: Cluster dict with articles
+
+    Returns:
+        Dict with title, summary, links
+    """
+    response = await _stream_until(_build_story_summary_messages(cluster), _summary_line_complete)
+    return _parse_story_summary(response, cluster)
+
+
 async def generate_story_summaries(
     story_clusters: List[Dict[str, Any]]
 ) -> List[Dict[str, Any]]:
@@ -653,42 +1279,24 @@ async def generate_story_summaries(
     if not story_clusters:
         return []
 
-    try:
-        # Generate all summaries in parallel
-        import asyncio
-        summaries = await asyncio.gather(*[
-            _generate_single_story_summary(cluster)
-            for cluster in story_clusters
-        ])
+    # Generate all summaries in parallel; _stream_until never raises, and a failed
+    # stream falls back to the cluster's first article in _parse_story_summary
+    summaries = await asyncio.gather(*[
+        _generate_single_story_summary(cluster)
+        for cluster in story_clusters
+    ])
 
-        logger.info(f"Generated {len(summaries)} story summaries")
-        return list(summaries)
+    logger.info(f"Generated {len(summaries)} story summaries")
+    return summaries
 
-    except Exception as e:
-        logger.error(f"Error generating summaries: {e}")
-        # Fallback - deduplicate links here too
-        fallback_summaries = []
-        for cluster in story_clusters:
-            seen_urls = set()
-            links = []
-            for a in cluster["articles"]:
-                url = a.get('link', '')
-                if url and url not in seen_urls:
-                    seen_urls.add(url)
-                    links.append({
-                        "source": a.get('source', 'Unknown'),
-                        "url": url
-                    })
-
-            fallback_summaries.append({
-                "title": cluster["articles"][0].get('title', 'News Update'),
-                "summary": cluster["articles"][0].get('description', '')[:100],
-                "links": links
-            })
-        return fallback_summaries
 
+def _format_story(story: Dict[str, Any]) -> str:
+    """Format one story: plain bold title, one-sentence summary, bullet-separated source links."""
+    source_links = " • ".join(f"[{link['source']}]({link['url']})" for link in story['links'])
+    return f"**{story['title']}**\n{story['summary']}\n{source_links}\n"
 
-async def generate_summary_text(
+
+def generate_summary_text(
     story_summaries: List[Dict[str, Any]],
     edition: str = "Summary"
 ) -> str:
@@ -706,24 +1314,12 @@ async def generate_summary_text(
         return "No articles available for summary."
 
     try:
-        summary_lines = ["**Top Stories:**\n"]
-
-        for story in story_summaries:
-            # Plain text title (user preference)
-            summary_lines.append(f"**{story['title']}**")
-
-            # One-sentence summary
-            summary_lines.append(f"{story['summary']}")
-
-            # Named source links with bullet separators
-            source_links = [
-                f"[{link['source']}]({link['url']})"
-                for link in story['links']
-            ]
-            summary_lines.append(f"{' • '.join(source_links)}\n")
+        summary_text = "**Top Stories:**\n\n" + "\n".join(
+            _format_story(story) for story in story_summaries
+        )
 
         logger.info(f"Formatted {len(story_summaries)} stories")
-        return "\n".join(summary_lines)
+        return summary_text
 
     except Exception as e:
         logger.error(f"Error formatting: {e}")
@@ -749,16 +1345,13 @@ def generate_fallback_summary(articles: List[Dict[str, Any]]) -> str:
     Returns:
         Simple markdown list of article titles and links
     """
-    lines = ["Here are today's top stories:"]
-
-    for i, article in enumerate(articles, 1):
-        title = article.get('title', 'Untitled')
-        link = article.get('link', '')
-        source = article.get('source', 'Unknown')
-
-        lines.append(f"{i}. [{title}]({link}) - {source}")
-
-    return "\n".join(lines)
+    return "\n".join((
+        "Here are today's top stories:",
+        *(
+            f"{i}. [{a.get('title', 'Untitled')}]({a.get('link', '')}) - {a.get('source', 'Unknown')}"
+            for i, a in enumerate(articles, 1)
+        ),
+    ))
 
 
 async def generate_news_summary(
@@ -828,12 +1421,9 @@ async def generate_news_summary(
         before_diversity = len(articles)
 
         # Re-group articles by feed
-        articles_by_feed = {}
+        articles_by_feed = defaultdict(list)
         for article in articles:
-            feed = article.get('feed_name', 'Unknown')
-            if feed not in articles_by_feed:
-                articles_by_feed[feed] = []
-            articles_by_feed[feed].append(article)
+            articles_by_feed[article.get('feed_name', 'Unknown')].append(article)
 
         # Sort each feed's articles by recency
         for feed in articles_by_feed:
@@ -855,10 +1445,7 @@ async def generate_news_summary(
         stats["filtered_by_limit"] = before_diversity - len(articles)
 
         # Track feed distribution for stats
-        feed_counts = {}
-        for article in articles:
-            feed = article.get('feed_name', 'Unknown')
-            feed_counts[feed] = feed_counts.get(feed, 0) + 1
+        feed_counts = dict(Counter(article.get('feed_name', 'Unknown') for article in articles))
 
         stats["feed_distribution"] = feed_counts
         logger.info(f"Applied '{diversity_config['strategy']}' diversity: {feed_counts}")
@@ -874,6 +1461,15 @@ async def generate_news_summary(
 
     stats["after_initial_limit"] = len(articles)
 
+    # Resolve per-article field defaults once for every step below
+    articles = _normalize_articles(articles)
+
+    # Drop repeated and syndicated copies so no LLM step pays for them
+    before_near_dup = len(articles)
+    articles = _dedup_articles(articles)
+    if len(articles) < before_near_dup:
+        logger.info(f"Duplicate article removal: {before_near_dup} -> {len(articles)} articles")
+
     # Step 0: Filter articles by feed instructions
     if filter_map:
         before_filter = len(articles)
@@ -885,13 +1481,12 @@ async def generate_news_summary(
         stats["after_feed_filter"] = len(articles)
 
     # Step 0.5: Article-level deduplication (filter out URLs already used today)
-    if story_history:
-        used_urls = set()
-        for story in story_history:
-            used_urls.update(story.get("article_urls", []))
-
+    used_urls = frozenset(
+        url for story in story_history or () for url in story.get("article_urls", ())
+    )
+    if used_urls:
         before_dedup = len(articles)
-        articles = [a for a in articles if a.get("link") not in used_urls]
+        articles = [a for a in articles if a["link"] not in used_urls]
         stats["filtered_by_url_dedup"] = before_dedup - len(articles)
         stats["after_url_dedup"] = len(articles)
         logger.info(f"Article-level dedup: {before_dedup} -> {len(articles)} articles ({len(used_urls)} URLs filtered)")
@@ -909,15 +1504,12 @@ async def generate_news_summary(
     else:
         stats["after_url_dedup"] = len(articles)
 
-    # Step 1: Rank articles by importance
-    ranked_articles = await rank_articles_by_importance(articles)
-
-    # Step 2: Take top N articles
-    top_articles = ranked_articles[:top_articles_limit]
-    logger.info(f"Selected top {len(top_articles)} articles from {len(ranked_articles)} ranked articles")
-
-    # Step 3: Cluster articles into stories
-    story_clusters = await cluster_articles_by_story(top_articles, max_clusters=cluster_limit)
+    # Steps 1-3: Rank articles by importance, take the top N, and cluster them into stories
+    top_articles, story_clusters = await rank_and_cluster_articles(
+        articles,
+        top_n=top_articles_limit,
+        max_clusters=cluster_limit
+    )
 
     # Step 3.5: Story-level deduplication (filter duplicate stories)
     if story_history:
@@ -943,7 +1535,7 @@ async def generate_news_summary(
     story_summaries = await generate_story_summaries(story_clusters)
 
     # Step 5: Format as Discord markdown
-    summary_text = await generate_summary_text(story_summaries, edition)
+    summary_text = generate_summary_text(story_summaries, edition)
 
     logger.info(f"Summary generated: {len(story_clusters)} unique stories from {len(articles)} articles")
 
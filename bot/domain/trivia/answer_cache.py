@@ -0,0 +1,75 @@
+"""In-process cache of LLM verdicts for open-ended trivia answers."""
+
+import hashlib
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+import orjson
+
+# Verdicts are reused for a day; enough to cover a question being replayed across guilds
+ANSWER_CACHE_MAX_SIZE = 10_000
+ANSWER_CACHE_TTL_SECONDS = 86_400
+
+
+def _normalize(answer: str) -> str:
+    return answer.strip().lower()
+
+
+class LLMAnswerCache:
+    """
+    Cache of validate_answer verdicts.
+
+    Keyed by a hash of (question, correct answer, normalized user answer), so only
+    the same answer (ignoring case and surrounding whitespace) reuses a verdict.
+    Paraphrases are judged afresh: near-identical wordings such as "World War I"
+    and "World War II" can have opposite verdicts.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = ANSWER_CACHE_MAX_SIZE,
+        ttl: float = ANSWER_CACHE_TTL_SECONDS,
+    ):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._exact: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+
+    @staticmethod
+    def _key(*parts: str) -> str:
+        return hashlib.sha256(orjson.dumps(parts)).hexdigest()
+
+    def _exact_key(self, question: str, correct_answer: str, user_answer: str) -> str:
+        return self._key(question, correct_answer, _normalize(user_answer))
+
+    def get(self, question: str, correct_answer: str, user_answer: str) -> Optional[Dict[str, Any]]:
+        """Return the cached verdict for this exact answer, if still fresh."""
+        key = self._exact_key(question, correct_answer, user_answer)
+        entry = self._exact.get(key)
+        if entry is None:
+            return None
+
+        stored_at, verdict = entry
+        if time.monotonic() - stored_at > self.ttl:
+            del self._exact[key]
+            return None
+
+        self._exact.move_to_end(key)
+        return dict(verdict)
+
+    def put(
+        self,
+        question: str,
+        correct_answer: str,
+        user_answer: str,
+        verdict: Dict[str, Any],
+    ) -> None:
+        """Store a verdict for this exact answer."""
+        key = self._exact_key(question, correct_answer, user_answer)
+        self._exact[key] = (time.monotonic(), dict(verdict))
+        self._exact.move_to_end(key)
+        if len(self._exact) > self.maxsize:
+            self._exact.popitem(last=False)
+
+    def clear(self) -> None:
+        self._exact.clear()
@@ -1,21 +1,100 @@
 """LLM-based answer validation for trivia questions."""
 
+import functools
 import json
 import re
-from typing import Dict
+from typing import Dict, Optional
 
 from bot.api.openai.chat_completions_client import ChatCompletionsClient
 from bot.app.utils.logger import get_logger
+from bot.domain.trivia.answer_cache import LLMAnswerCache
 
 logger = get_logger()
 
+# Verdicts for open-ended answers, shared by every game in this process
+_answer_cache = LLMAnswerCache()
+# Shared judge client, created on first use
+_JUDGE: Optional[ChatCompletionsClient] = None
+
+JUDGE_MODEL = "gpt-4o-mini"
+# A verdict is a two-field JSON object; leave room for a sentence of feedback
+JUDGE_MAX_TOKENS = 100
+_JUDGE_SYSTEM_MESSAGE = {
+    "role": "system",
+    "content": "You are a fair trivia judge. Be lenient with formatting but strict with facts. Return only JSON."
+}
+
+_JUDGE_PROMPT_HEAD = "Evaluate if the user's answer is correct.\n\nQuestion: "
+_JUDGE_PROMPT_TAIL = """
+
+Consider:
+- Exact matches (1914 = 1914)
+- Semantic equivalence (WW1 = World War 1 = First World War)
+- Minor spelling errors (Shakespere = Shakespeare)
+- Reasonable variations (USA = United States = America)
+
+Reject:
+- Completely wrong answers
+- Opposite answers
+- Off-by-one errors for dates/numbers (1914 ≠ 1915)
+
+Return JSON: {"is_correct": true/false, "feedback": "brief explanation"}"""
+
+_DECODER = json.JSONDecoder()
+
+# Plain numbers (years, counts) are judged locally: the judge's rule for them is exact equality
+_NUMBER_RE = re.compile(r'-?\d+(?:\.\d+)?')
+
+
+@functools.lru_cache(maxsize=1024)
+def _normalized_options(options: tuple) -> frozenset:
+    """Lowercased, stripped options; computed once per question across all players."""
+    return frozenset(option.strip().lower() for option in options)
+
+
+def _judge() -> ChatCompletionsClient:
+    """Return the module's shared judge client."""
+    global _JUDGE
+    if _JUDGE is None:
+        _JUDGE = ChatCompletionsClient.factory(JUDGE_MODEL)
+    return _JUDGE
+
+
+async def _judge_with_llm(user_answer: str, correct_answer: str, question: str) -> Optional[Dict[str, any]]:
+    """Ask the LLM judge for a verdict (None if its reply can't be parsed)."""
+    prompt = "".join((
+        _JUDGE_PROMPT_HEAD, question,
+        "\nCorrect Answer: ", correct_answer,
+        "\nUser's Answer: ", user_answer,
+        _JUDGE_PROMPT_TAIL
+    ))
+
+    response = await _judge().chat(
+        [_JUDGE_SYSTEM_MESSAGE, {"role": "user", "content": prompt}],
+        max_tokens=JUDGE_MAX_TOKENS,
+        response_format={"type": "json_object"},
+        temperature=0
+    )
+
+    # Decode the first JSON object in the reply (nested braces included)
+    start = response.find("{")
+    if start == -1:
+        return None
+
+    result, _ = _DECODER.raw_decode(response, start)
+    return {
+        "is_correct": bool(result.get("is_correct", False)),
+        "feedback": str(result.get("feedback", ""))
+    }
+
 
 async def validate_answer(user_answer: str, correct_answer: str, question: str, options: list = None) -> Dict[str, any]:
     """
     Validate if user's answer is correct.
 
     For multiple choice questions (with options), uses exact string matching.
-    For open-ended questions (AI-generated), uses LLM validation.
+    For open-ended questions (AI-generated), uses LLM validation, reusing cached
+    verdicts for repeated answers to the same question.
 
     Args:
         user_answer: The answer submitted by the user
@@ -41,15 +120,12 @@ async def validate_answer(user_answer: str, correct_answer: str, question: str,
                 "feedback": "Exact match"
             }
 
-        # Check if answer matches any of the options (and it matches correct answer)
-        for option in options:
-            if user_lower == option.strip().lower():
-                # User selected a valid option, check if it's correct
-                is_correct = (user_lower == correct_lower)
-                return {
-                    "is_correct": is_correct,
-                    "feedback": "Exact match" if is_correct else "Incorrect option"
-                }
+        # User selected a valid option other than the correct one
+        if user_lower in _normalized_options(tuple(options)):
+            return {
+                "is_correct": False,
+                "feedback": "Incorrect option"
+            }
 
         # User's answer doesn't match any option
         return {
@@ -57,44 +133,26 @@ async def validate_answer(user_answer: str, correct_answer: str, question: str,
             "feedback": "Answer does not match any option"
         }
 
-    # For AI questions (no options), use LLM validation
-    try:
-        prompt = f"""Evaluate if the user's answer is correct.
-
-Question: {question}
-Correct Answer: {correct_answer}
-User's Answer: {user_answer}
-
-Consider:
-- Exact matches (1914 = 1914)
-- Semantic equivalence (WW1 = World War 1 = First World War)
-- Minor spelling errors (Shakespere = Shakespeare)
-- Reasonable variations (USA = United States = America)
+    # Numeric answers are right only if equal, so there's nothing for the LLM to judge
+    user_stripped = user_answer.strip()
+    correct_stripped = correct_answer.strip()
+    if _NUMBER_RE.fullmatch(user_stripped) and _NUMBER_RE.fullmatch(correct_stripped):
+        is_correct = float(user_stripped) == float(correct_stripped)
+        return {
+            "is_correct": is_correct,
+            "feedback": "Exact match" if is_correct else f"The answer is {correct_stripped}"
+        }
 
-Reject:
-- Completely wrong answers
-- Opposite answers
-- Off-by-one errors for dates/numbers (1914 ≠ 1915)
+    # For AI questions (no options), reuse an earlier verdict for this exact answer
+    cached = _answer_cache.get(question, correct_answer, user_answer)
+    if cached is not None:
+        return cached
 
-Return JSON: {{"is_correct": true/false, "feedback": "brief explanation"}}"""
-
-        llm = ChatCompletionsClient.factory("gpt-4o-mini")
-        response = await llm.chat([
-            {
-                "role": "system",
-                "content": "You are a fair trivia judge. Be lenient with formatting but strict with facts. Return only JSON."
-            },
-            {"role": "user", "content": prompt}
-        ])
-
-        # Parse JSON from response
-        json_match = re.search(r'\{[^}]+\}', response, re.DOTALL)
-        if json_match:
-            result = json.loads(json_match.group())
-            return {
-                "is_correct": bool(result.get("is_correct", False)),
-                "feedback": str(result.get("feedback", ""))
-            }
+    try:
+        verdict = await _judge_with_llm(user_answer, correct_answer, question)
+        if verdict is not None:
+            _answer_cache.put(question, correct_answer, user_answer, verdict)
+            return verdict
 
     except Exception as e:
         logger.error(f"Error validating answer: {e}")
@@ -42,6 +42,25 @@ OPENTDB_CATEGORIES = {
     32: "Entertainment: Cartoon & Animations",
 }
 
+_OPENTDB_CATEGORY_IDS = tuple(OPENTDB_CATEGORIES)
+
+
+def _build_question(q: Dict[str, str], category_name: str) -> Dict[str, str]:
+    """Convert a raw OpenTDB question into the standardized question schema."""
+    # Combine correct + incorrect answers in random order
+    answers = [q["correct_answer"], *q.get("incorrect_answers", ())]
+    options = random.sample(answers, len(answers))
+
+    return {
+        "question": q["question"],
+        "correct_answer": q["correct_answer"],
+        "options": options,
+        "category": category_name,
+        "explanation": f"This is a {q['difficulty']} question from {category_name}.",
+        "difficulty": q["difficulty"],
+        "source": "opentdb"
+    }
+
 
 async def generate_trivia_questions_from_opentdb(
     easy_count: int,
@@ -77,93 +96,29 @@ async def generate_trivia_questions_from_opentdb(
     """
     # Use provided category (from round-robin rotation) or fall back to random
     if category_id is None:
-        category_id = random.choice(list(OPENTDB_CATEGORIES.keys()))
+        category_id = random.choice(_OPENTDB_CATEGORY_IDS)
     category_name = OPENTDB_CATEGORIES[category_id]
 
     logger.info(f"Selected OpenTDB category: {category_name} (ID: {category_id})")
 
     client = OpenTDBClient()
-    questions = []
 
     try:
-        # Fetch questions by difficulty with delays to avoid rate limiting
-        # OpenTDB rate limits: 1 request per 5 seconds
-
-        if easy_count > 0:
-            logger.info(f"Fetching {easy_count} easy questions from OpenTDB")
-            easy_questions = await client.fetch_questions(
-                amount=easy_count,
-                category=category_id,
-                difficulty="easy"
-            )
-            for q in easy_questions:
-                # Shuffle options: combine correct + incorrect, then randomize
-                options = [q["correct_answer"]] + q.get("incorrect_answers", [])
-                random.shuffle(options)
-
-                questions.append({
-                    "question": q["question"],
-                    "correct_answer": q["correct_answer"],
-                    "options": options,
-                    "category": category_name,
-                    "explanation": f"This is a {q['difficulty']} question from {category_name}.",
-                    "difficulty": q["difficulty"],
-                    "source": "opentdb"
-                })
-
-            # Add delay if we need to fetch more questions
-            if medium_count > 0 or hard_count > 0:
-                logger.info("Waiting 6 seconds to avoid OpenTDB rate limit...")
-                await asyncio.sleep(6)
-
-        if medium_count > 0:
-            logger.info(f"Fetching {medium_count} medium questions from OpenTDB")
-            medium_questions = await client.fetch_questions(
-                amount=medium_count,
-                category=category_id,
-                difficulty="medium"
-            )
-            for q in medium_questions:
-                # Shuffle options: combine correct + incorrect, then randomize
-                options = [q["correct_answer"]] + q.get("incorrect_answers", [])
-                random.shuffle(options)
-
-                questions.append({
-                    "question": q["question"],
-                    "correct_answer": q["correct_answer"],
-                    "options": options,
-                    "category": category_name,
-                    "explanation": f"This is a {q['difficulty']} question from {category_name}.",
-                    "difficulty": q["difficulty"],
-                    "source": "opentdb"
-                })
-
-            # Add delay if we need to fetch hard questions
-            if hard_count > 0:
-                logger.info("Waiting 6 seconds to avoid OpenTDB rate limit...")
-                await asyncio.sleep(6)
-
-        if hard_count > 0:
-            logger.info(f"Fetching {hard_count} hard questions from OpenTDB")
-            hard_questions = await client.fetch_questions(
-                amount=hard_count,
-                category=category_id,
-                difficulty="hard"
-            )
-            for q in hard_questions:
-                # Shuffle options: combine correct + incorrect, then randomize
-                options = [q["correct_answer"]] + q.get("incorrect_answers", [])
-                random.shuffle(options)
-
-                questions.append({
-                    "question": q["question"],
-                    "correct_answer": q["correct_answer"],
-                    "options": options,
-                    "category": category_name,
-                    "explanation": f"This is a {q['difficulty']} question from {category_name}.",
-                    "difficulty": q["difficulty"],
-                    "source": "opentdb"
-                })
+        # Fetch all difficulties concurrently; the client spaces the requests
+        # to respect OpenTDB's rate limit (1 request per 5 seconds)
+        difficulty_counts = [
+            (difficulty, count)
+            for difficulty, count in (("easy", easy_count), ("medium", medium_count), ("hard", hard_count))
+            if count > 0
+        ]
+        for difficulty, count in difficulty_counts:
+            logger.info(f"Fetching {count} {difficulty} questions from OpenTDB")
+        fetched = await asyncio.gather(*(
+            client.fetch_questions(amount=count, category=category_id, difficulty=difficulty)
+            for difficulty, count in difficulty_counts
+        ))
+
+        questions = [_build_question(q, category_name) for batch in fetched for q in batch]
 
         logger.info(f"✅ Successfully generated {len(questions)} questions from OpenTDB API")
         logger.info(f"   Category: {category_name}")
@@ -1,8 +1,10 @@
 """LLM-based trivia question generation with seed system."""
 
-import json
-import re
-from typing import Dict, List, Optional
+import asyncio
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+import orjson
 
 from bot.api.openai.chat_completions_client import ChatCompletionsClient
 from bot.app.utils.logger import get_logger
@@ -11,11 +13,57 @@ logger = get_logger()
 
 MAX_RETRIES = 3
 LLM_MODEL = "gpt-5.2"
+ANSWERABILITY_MODEL = "gpt-4o-mini"
+
+# Facts depend only on (seed, category), so the same seed drawn again (e.g. by
+# another guild) reuses them instead of repeating the research call
+FACTS_CACHE_SIZE = 256
+_FACTS_CACHE: "OrderedDict[Tuple[str, str], str]" = OrderedDict()
+# Facts lookups in progress, so concurrent games with the same seed share one call
+_FACTS_IN_FLIGHT: Dict[Tuple[str, str], "asyncio.Task[str]"] = {}
+
+# Generation and review replies use JSON mode, so they never arrive fenced or with prose
+_JSON_OBJECT_FORMAT = {"type": "json_object"}
+
+_FACTS_SYSTEM_MESSAGE = {
+    "role": "system",
+    "content": "You are a trivia research assistant. Provide specific, verifiable, interesting facts."
+}
+
+# Shared generation and review clients, created on first use
+_LLM: Optional[ChatCompletionsClient] = None
+_REVIEWER: Optional[ChatCompletionsClient] = None
+
+# Every ASCII byte except a-z and 0-9; non-ASCII is dropped by the encode
+_NON_ALNUM_BYTES = bytes(b for b in range(128) if not (97 <= b <= 122 or 48 <= b <= 57))
 
 
 def normalize_text(text: str) -> str:
     """Remove spaces and special characters, lowercase."""
-    return re.sub(r'[^a-z0-9]', '', text.lower())
+    return text.lower().encode("ascii", "ignore").translate(None, _NON_ALNUM_BYTES).decode("ascii")
+
+
+def _llm() -> ChatCompletionsClient:
+    """Return the module's shared generation client."""
+    global _LLM
+    if _LLM is None:
+        _LLM = ChatCompletionsClient.factory(LLM_MODEL)
+    return _LLM
+
+
+def _reviewer() -> ChatCompletionsClient:
+    """Return the module's shared answerability-review client."""
+    global _REVIEWER
+    if _REVIEWER is None:
+        _REVIEWER = ChatCompletionsClient.factory(ANSWERABILITY_MODEL)
+    return _REVIEWER
+
+
+def _json_list(data: Any, key: str) -> Optional[list]:
+    """The list under key in a JSON-mode reply (or the reply itself if it is a bare list)."""
+    if isinstance(data, dict):
+        data = data.get(key)
+    return data if isinstance(data, list) else None
 
 
 def answer_appears_in_question(question: str, answer: str) -> bool:
@@ -25,15 +73,19 @@ def answer_appears_in_question(question: str, answer: str) -> bool:
     """
     normalized_question = normalize_text(question)
 
-    # Split answer into words and check each significant word (length > 3)
-    answer_words = answer.split()
-    for word in answer_words:
-        if len(word) > 3:  # Only check significant words
-            normalized_word = normalize_text(word)
-            if normalized_word in normalized_question:
-                return True
+    # Only significant words (length > 3) count
+    return any(
+        normalize_text(word) in normalized_question
+        for word in answer.split()
+        if len(word) > 3
+    )
 
-    return False
+
+def _cache_facts(key: Tuple[str, str], facts: str) -> None:
+    _FACTS_CACHE[key] = facts
+    _FACTS_CACHE.move_to_end(key)
+    if len(_FACTS_CACHE) > FACTS_CACHE_SIZE:
+        _FACTS_CACHE.popitem(last=False)
 
 
 async def _gather_facts(seed: str, category: str) -> str:
@@ -50,9 +102,27 @@ async def _gather_facts(seed: str, category: str) -> str:
     Raises:
         Exception: On LLM failure (caller handles retry)
     """
-    parts = seed.split(" :: ")
-    topic = parts[0].strip()
-    context = parts[1].strip() if len(parts) > 1 else "general"
+    key = (seed, category)
+    cached = _FACTS_CACHE.get(key)
+    if cached is not None:
+        _FACTS_CACHE.move_to_end(key)
+        return cached
+
+    task = _FACTS_IN_FLIGHT.get(key)
+    if task is None:
+        task = asyncio.ensure_future(_fetch_facts(seed, category))
+        _FACTS_IN_FLIGHT[key] = task
+        task.add_done_callback(lambda _: _FACTS_IN_FLIGHT.pop(key, None))
+
+    # Shielded so one caller being cancelled doesn't cancel the lookup for the others
+    return await asyncio.shield(task)
+
+
+async def _fetch_facts(seed: str, category: str) -> str:
+    """Ask the LLM for facts about a seed missing from the cache, and cache them."""
+    topic, sep, context = seed.partition(" :: ")
+    topic = topic.strip()
+    context = context.strip() if sep else "general"
 
     prompt = f"""Tell me 20 interesting facts about "{topic}" (angle: {context}, category: {category}).
 
@@ -66,16 +136,55 @@ Each fact should be specific enough that a good trivia question could be built f
 
 Return as a numbered list with difficulty tags."""
 
-    llm = ChatCompletionsClient.factory(LLM_MODEL)
-    response = await llm.chat([
-        {"role": "system", "content": "You are a trivia research assistant. Provide specific, verifiable, interesting facts."},
-        {"role": "user", "content": prompt}
-    ])
+    response = await _llm().chat(
+        [_FACTS_SYSTEM_MESSAGE, {"role": "user", "content": prompt}],
+        raise_errors=True
+    )
+    # An empty reply is a failed lookup: raise so the caller retries, and don't cache it
+    if not response.strip():
+        raise ValueError(f"LLM returned no facts for seed '{seed}'")
 
+    _cache_facts((seed, category), response)
     return response
 
 
-ANSWERABILITY_MODEL = "gpt-4o-mini"
+_ANSWERABILITY_SYSTEM_MESSAGE = {
+    "role": "system",
+    "content": "You are a trivia quality reviewer. Your job is to identify questions that are too vague to answer and rewrite them to include sufficient context. Keep the same answer and difficulty level when rewriting.",
+}
+
+# Static instructions come first and the questions last, so repeated calls share
+# a prompt prefix the provider can cache
+_ANSWERABILITY_PROMPT_PREFIX = """Review each trivia question listed at the end. For each one, determine if a knowledgeable person could answer it WITHOUT needing to guess what topic, franchise, person, or domain is being referenced.
+
+A question is UNANSWERABLE if it:
+- Uses vague references like "a major film franchise", "a famous scientist", "a popular video game" instead of naming the specific subject
+- Omits key context needed to narrow down the answer (e.g., asking about "the alien species in the novels" without saying which novels)
+- Could reasonably apply to multiple different subjects
+
+A question is ANSWERABLE if it provides enough specific context that a knowledgeable person could figure out the answer, even if the question is difficult.
+
+A question marked "Problem: the answer appears in the question text" must be treated as unanswerable and rewritten so it no longer gives away the answer.
+
+Respond with a JSON object in this format, with one review per question:
+{
+  "reviews": [
+    {
+      "index": 1,
+      "answerable": true
+    },
+    {
+      "index": 2,
+      "answerable": false,
+      "rewritten_question": "A improved version of the question that includes enough specific context to be answerable, while still not giving away the answer"
+    }
+  ]
+}
+
+Only include "rewritten_question" for questions where answerable is false.
+
+Questions to review:
+"""
 
 
 async def _validate_and_fix_answerability(
@@ -83,7 +192,7 @@ async def _validate_and_fix_answerability(
 ) -> List[Dict[str, str]]:
     """
     Phase 3: Validate that each question is answerable without extra context,
-    and rewrite any that are too vague.
+    and rewrite any that are too vague or that give away their answer.
 
     A question is "unanswerable" if it uses vague references (e.g., "a major franchise",
     "a famous scientist") instead of naming the specific subject, making it impossible
@@ -97,58 +206,21 @@ async def _validate_and_fix_answerability(
     """
     questions_for_review = []
     for i, q in enumerate(questions):
-        questions_for_review.append(
-            f'{i + 1}. Question: "{q["question"]}"\n   Answer: "{q["correct_answer"]}"'
-        )
-
-    prompt = f"""Review each trivia question below. For each one, determine if a knowledgeable person could answer it WITHOUT needing to guess what topic, franchise, person, or domain is being referenced.
+        line = f'{i + 1}. Question: "{q["question"]}"\n   Answer: "{q["correct_answer"]}"'
+        # Fix answer leaks in this same call rather than with a separate rewrite round-trip
+        if answer_appears_in_question(q["question"], q["correct_answer"]):
+            line += "\n   Problem: the answer appears in the question text"
+        questions_for_review.append(line)
 
-A question is UNANSWERABLE if it:
-- Uses vague references like "a major film franchise", "a famous scientist", "a popular video game" instead of naming the specific subject
-- Omits key context needed to narrow down the answer (e.g., asking about "the alien species in the novels" without saying which novels)
-- Could reasonably apply to multiple different subjects
+    prompt = _ANSWERABILITY_PROMPT_PREFIX + "\n".join(questions_for_review)
 
-A question is ANSWERABLE if it provides enough specific context that a knowledgeable person could figure out the answer, even if the question is difficult.
-
-Questions to review:
-{chr(10).join(questions_for_review)}
-
-For each question, respond in this JSON format:
-[
-  {{
-    "index": 1,
-    "answerable": true
-  }},
-  {{
-    "index": 2,
-    "answerable": false,
-    "rewritten_question": "A improved version of the question that includes enough specific context to be answerable, while still not giving away the answer"
-  }}
-]
-
-Only include "rewritten_question" for questions where answerable is false.
-Return ONLY the JSON array, no other text."""
-
-    llm = ChatCompletionsClient.factory(ANSWERABILITY_MODEL)
     try:
-        response = await llm.chat([
-            {
-                "role": "system",
-                "content": "You are a trivia quality reviewer. Your job is to identify questions that are too vague to answer and rewrite them to include sufficient context. Keep the same answer and difficulty level when rewriting.",
-            },
-            {"role": "user", "content": prompt},
-        ])
-
-        response_clean = response.strip()
-        if response_clean.startswith("```json"):
-            response_clean = response_clean[7:]
-        if response_clean.startswith("```"):
-            response_clean = response_clean[3:]
-        if response_clean.endswith("```"):
-            response_clean = response_clean[:-3]
-        response_clean = response_clean.strip()
-
-        reviews = json.loads(response_clean)
+        response = await _reviewer().chat(
+            [_ANSWERABILITY_SYSTEM_MESSAGE, {"role": "user", "content": prompt}],
+            response_format=_JSON_OBJECT_FORMAT
+        )
+
+        reviews = _json_list(orjson.loads(response), "reviews") or []
 
         rewrite_count = 0
         for review in reviews:
@@ -172,6 +244,43 @@ Return ONLY the JSON array, no other text."""
     return questions
 
 
+_GENERATION_SYSTEM_MESSAGE = {
+    "role": "system",
+    "content": "You are a trivia question creator. Create questions where the answer is NOT mentioned or hinted at in the question text. Return only valid JSON.",
+}
+
+# Static instructions come first and the per-call category, facts and counts
+# last, so repeated calls share a prompt prefix the provider can cache
+_GENERATION_PROMPT_PREFIX = """Using the facts given below, create trivia questions for the given category.
+
+Requirements:
+- Each question must be based on one or more of the facts given
+- CRITICAL: The answer must NOT appear anywhere in the question text
+- EQUALLY CRITICAL: Each question MUST contain enough specific context to be answerable. Do NOT use vague references like "a major franchise" or "a famous scientist" — name the specific franchise, person, era, or domain being asked about. A knowledgeable person should be able to answer without guessing what topic is being referenced.
+- Easy questions: test common knowledge that most people would know
+- Medium questions: require some familiarity with the topic
+- Hard questions: test deep or obscure knowledge
+- Answers should be specific (a name, place, thing, concept, etc.)
+- Each question needs a 2-3 sentence explanation
+- All questions should be in the given category
+- Check each question before returning it: if its text contains the answer (or a significant word of it), set "answer_leaked" to true and give a rewritten question that doesn't in "question_sanitized"
+
+Return a JSON object with this EXACT structure:
+{
+  "questions": [
+    {
+      "question": "Your question here",
+      "correct_answer": "Specific answer",
+      "category": "The given category",
+      "explanation": "2-3 sentence explanation",
+      "difficulty": "easy|medium|hard",
+      "answer_leaked": false,
+      "question_sanitized": "Only when answer_leaked is true: the question rewritten without the answer"
+    }
+  ]
+}"""
+
+
 async def _generate_from_facts(
     facts: str,
     category: str,
@@ -222,62 +331,29 @@ async def _generate_from_facts(
                 "but NOT duplicate or closely overlap:\n" + "\n".join(context_lines)
             )
 
-    prompt = f"""Using the facts below, create trivia questions for the category "{category}".
+    prompt = f"""{_GENERATION_PROMPT_PREFIX}
+
+Category: "{category}"
 
 Facts:
 {facts}
 
 Generate:
 {difficulty_spec}
+{context_section}"""
 
-Requirements:
-- Each question must be based on one or more of the facts above
-- CRITICAL: The answer must NOT appear anywhere in the question text
-- EQUALLY CRITICAL: Each question MUST contain enough specific context to be answerable. Do NOT use vague references like "a major franchise" or "a famous scientist" — name the specific franchise, person, era, or domain being asked about. A knowledgeable person should be able to answer without guessing what topic is being referenced.
-- Easy questions: test common knowledge that most people would know
-- Medium questions: require some familiarity with the topic
-- Hard questions: test deep or obscure knowledge
-- Answers should be specific (a name, place, thing, concept, etc.)
-- Each question needs a 2-3 sentence explanation
-- All questions should be in the "{category}" category
-{context_section}
-
-Return a JSON array with this EXACT structure:
-[
-  {{
-    "question": "Your question here",
-    "correct_answer": "Specific answer",
-    "category": "{category}",
-    "explanation": "2-3 sentence explanation",
-    "difficulty": "easy|medium|hard"
-  }}
-]
-
-Return ONLY the JSON array, no other text."""
-
-    llm = ChatCompletionsClient.factory(LLM_MODEL)
-    response = await llm.chat([
-        {"role": "system", "content": "You are a trivia question creator. Create questions where the answer is NOT mentioned or hinted at in the question text. Return only valid JSON."},
-        {"role": "user", "content": prompt}
-    ])
-
-    # Strip markdown code block wrapping if present
-    response_clean = response.strip()
-    if response_clean.startswith("```json"):
-        response_clean = response_clean[7:]
-    if response_clean.startswith("```"):
-        response_clean = response_clean[3:]
-    if response_clean.endswith("```"):
-        response_clean = response_clean[:-3]
-    response_clean = response_clean.strip()
+    response = await _llm().chat(
+        [_GENERATION_SYSTEM_MESSAGE, {"role": "user", "content": prompt}],
+        response_format=_JSON_OBJECT_FORMAT
+    )
 
     try:
-        questions_data = json.loads(response_clean)
-    except json.JSONDecodeError as e:
+        questions_data = _json_list(orjson.loads(response), "questions")
+    except orjson.JSONDecodeError as e:
         raise ValueError(f"Invalid JSON response: {e}. Response was: {response[:500]}")
 
-    if not isinstance(questions_data, list):
-        raise ValueError("Response is not a JSON array")
+    if questions_data is None:
+        raise ValueError("Response has no questions array")
 
     # Validate and normalize each question
     validated_questions = []
@@ -301,9 +377,14 @@ Return ONLY the JSON array, no other text."""
                 logger.warning(f"Question {i + 1}: Invalid difficulty '{difficulty}', defaulting to medium")
                 difficulty = "medium"
 
-            # Check if answer appears in question — log warning but accept
+            # Prefer the model's own sanitized rewrite of a leaking question; any
+            # leak left after that is rewritten in phase 3
             if answer_appears_in_question(question, answer):
-                logger.warning(f"Question {i + 1}: Answer appears in question text")
+                sanitized = (q_data.get("question_sanitized") or "").strip()
+                if sanitized and not answer_appears_in_question(sanitized, answer):
+                    question = sanitized
+                else:
+                    logger.warning(f"Question {i + 1}: Answer appears in question text")
 
             validated_questions.append({
                 "question": question,
@@ -351,6 +432,7 @@ async def generate_trivia_questions(
         List of question dicts with keys: question, correct_answer, category, explanation, difficulty
 
     Raises:
+        ValueError: If the seed is blank or contains non-printable characters
         Exception: If generation fails after MAX_RETRIES attempts
     """
     total_count = easy_count + medium_count + hard_count
@@ -358,6 +440,10 @@ async def generate_trivia_questions(
     if total_count == 0:
         return []
 
+    # A blank or garbled seed can't produce a topic; fail before spending any LLM calls
+    if not seed.strip() or not seed.isprintable():
+        raise ValueError(f"Invalid seed: {seed!r}")
+
     facts = None
     last_error = None
 
@@ -1,15 +1,23 @@
 """Seed system for generating unique trivia questions."""
 
+import functools
+import itertools
 import random
-from typing import List, NamedTuple, Optional
+from typing import AbstractSet, NamedTuple, Optional, Sequence, Tuple
 
 from bot.app.utils.logger import get_logger
 
 logger = get_logger()
 
+# Seed picks draw from their own generator rather than the shared module-level one;
+# its methods are bound once since every pick goes through them
+_rng = random.Random()
+_choice = _rng.choice
+_randrange = _rng.randrange
+
 
 # 24 OpenTDB category names
-CATEGORIES = [
+CATEGORIES = (
     "General Knowledge",
     "Entertainment: Books",
     "Entertainment: Film",
@@ -34,7 +42,13 @@ CATEGORIES = [
     "Science: Gadgets",
     "Entertainment: Japanese Anime & Manga",
     "Entertainment: Cartoon & Animations",
-]
+)
+
+
+# Random picks to try before enumerating; while under half the seeds are used,
+# 10 picks all colliding has probability < 0.1%
+FAST_PATH_ATTEMPTS = 10
+FAST_PATH_MAX_USED_RATIO = 0.5
 
 
 class SeedResult(NamedTuple):
@@ -44,7 +58,7 @@ class SeedResult(NamedTuple):
 
 # Seeds organized by category
 CATEGORIZED_SEEDS = {
-    "General Knowledge": [
+    "General Knowledge": (
         "fandom", "canon", "lore", "continuity", "multiverse", "timeline",
         "origin story", "mythos", "worldbuilding", "easter egg", "deep cut",
         "reference", "homage", "spoiler", "meme", "fan theory", "headcanon",
@@ -52,9 +66,9 @@ CATEGORIZED_SEEDS = {
         "tier list", "crossover", "expanded universe", "internet culture",
         "english", "spelling", "language", "grammar", "phonology", "phonetics",
         "morphology", "syntax", "semantics", "pragmatics",
-    ],
+    ),
 
-    "Entertainment: Books": [
+    "Entertainment: Books": (
         "fantasy novels", "science fiction books", "mystery novels",
         "classic literature", "comic books", "bestselling authors",
         "book adaptations", "poetry", "horror fiction", "young adult fiction",
@@ -64,9 +78,9 @@ CATEGORIZED_SEEDS = {
         "high fantasy", "dark fantasy", "grimdark",
         "spaceship", "hyperspace", "alien", "first contact", "android",
         "singularity", "time travel", "parallel universe", "alternate timeline",
-    ],
+    ),
 
-    "Entertainment: Film": [
+    "Entertainment: Film": (
         "blockbuster movies", "film directors", "movie franchises",
         "animated films", "horror movies", "film noir", "documentary films",
         "film scores", "movie trivia", "oscar winners", "cult classics",
@@ -74,23 +88,23 @@ CATEGORIZED_SEEDS = {
         "spaceship", "starship", "robot", "cyborg", "AI", "time loop",
         "terraforming", "mecha", "dragon", "elf", "dwarf",
         "legendary weapon", "fallen kingdom",
-    ],
+    ),
 
-    "Entertainment: Music": [
+    "Entertainment: Music": (
         "music", "punk rock", "1990s alternative rock", "1970s rock",
         "classic rock", "grunge music", "EDM", "hip hop", "emo music",
         "2000s pop music", "2000s college rock", "indie rock", "indie music",
         "indie pop", "music news", "music industry", "music recording",
         "the beatles", "1980s music", "2000s music",
-    ],
+    ),
 
-    "Entertainment: Musicals & Theatres": [
+    "Entertainment: Musicals & Theatres": (
         "Broadway", "West End", "musical theatre", "opera",
         "Shakespeare plays", "Tony Awards", "famous playwrights", "ballet",
         "stand-up comedy", "improv", "pantomime", "cabaret",
-    ],
+    ),
 
-    "Entertainment: Television": [
+    "Entertainment: Television": (
         "sitcoms", "drama series", "reality TV", "talk shows",
         "animated series", "streaming services", "TV pilots", "Emmy Awards",
         "TV reboots", "miniseries",
@@ -101,9 +115,9 @@ CATEGORIZED_SEEDS = {
         "Milhouse Van Houten", "Nelson Muntz",
         "South Park", "Beavis and Butt-Head", "Daria", "Animaniacs",
         "MTV", "VH1", "Snick",
-    ],
+    ),
 
-    "Entertainment: Video Games": [
+    "Entertainment: Video Games": (
         "video game", "boss fight", "final boss", "NPC", "open world",
         "sandbox", "level up", "experience points", "skill tree", "perk",
         "loot", "grind", "side quest", "fast travel", "new game plus",
@@ -117,9 +131,9 @@ CATEGORIZED_SEEDS = {
         "idle game", "visual novel", "retro gaming", "arcade",
         "8-bit", "16-bit", "pixel art", "chiptune", "cartridge", "console war",
         "emulation", "romhack", "NES", "SNES",
-    ],
+    ),
 
-    "Entertainment: Board Games": [
+    "Entertainment: Board Games": (
         "board game", "deck building", "worker placement", "resource management",
         "area control", "cooperative play", "legacy game", "card game",
         "magic the gathering", "mtg", "pokemon", "yugioh",
@@ -128,115 +142,118 @@ CATEGORIZED_SEEDS = {
         "hit points", "character sheet", "character build", "class", "alignment",
         "game master", "homebrew", "one-shot", "minmaxing", "d&d",
         "dungeons and dragons",
-    ],
+    ),
 
-    "Science & Nature": [
+    "Science & Nature": (
         "photosynthesis", "black holes", "DNA", "periodic table", "evolution",
         "climate", "earthquakes", "electricity", "atoms", "planets",
         "ecosystems", "genetics", "human body", "chemistry",
-    ],
+    ),
 
-    "Science: Computers": [
+    "Science: Computers": (
         "programming", "artificial intelligence", "internet history",
         "cybersecurity", "operating systems", "databases", "algorithms",
         "web development", "computer hardware", "software engineering",
         "computer networking", "machine learning",
-    ],
+    ),
 
-    "Science: Mathematics": [
+    "Science: Mathematics": (
         "prime numbers", "geometry", "calculus", "probability", "statistics",
         "algebra", "fibonacci sequence", "pi", "mathematical proofs",
         "number theory", "fractals", "game theory",
-    ],
+    ),
 
-    "Mythology": [
+    "Mythology": (
         "greek mythology", "norse mythology", "egyptian mythology",
         "roman mythology", "japanese mythology", "celtic mythology",
         "hindu mythology", "creation myths", "mythical creatures",
         "legendary heroes", "underworld myths", "trickster gods",
-    ],
+    ),
 
-    "Sports": [
+    "Sports": (
         "sports", "San Diego Padres", "baseball", "MLB", "NBA", "NFL",
         "MLB All-Star Game", "Olympics",
-    ],
+    ),
 
-    "Geography": [
+    "Geography": (
         "continents", "capital cities", "mountains", "rivers", "islands",
         "deserts", "oceans", "national parks", "volcanoes", "rainforests",
+        # San Diego is listed three times on purpose to weight random picks
         "San Diego", "San Diego", "San Diego", "Southern California", "California",
-    ],
+    ),
 
-    "History": [
+    "History": (
         "ancient rome", "world war 2", "renaissance", "cold war",
         "industrial revolution", "silk road", "french revolution",
         "ancient egypt", "viking age", "roman empire", "medieval europe",
         "american civil war", "byzantine empire", "ottoman empire",
-    ],
+    ),
 
-    "Politics": [
+    "Politics": (
         "democracy", "elections", "united nations", "constitution",
         "political parties", "diplomacy", "civil rights movement",
         "propaganda", "monarchy", "revolution", "parliament",
         "political philosophy",
-    ],
+    ),
 
-    "Art": [
+    "Art": (
         "impressionism", "renaissance art", "modern art", "sculpture",
         "photography", "architecture", "art movements", "famous paintings",
         "street art", "digital art", "art history", "ceramics",
-    ],
+    ),
 
-    "Celebrities": [
+    "Celebrities": (
         "movie stars", "music legends", "famous athletes",
         "social media influencers", "celebrity scandals", "Hollywood",
         "famous couples", "award shows", "talk shows", "celebrity chefs",
         "fashion icons", "viral moments",
-    ],
+    ),
 
-    "Animals": [
+    "Animals": (
         "dogs", "dog breeds", "cat", "cat breeds", "farm animals",
         "wild animals", "domestic animals", "animals",
-    ],
+    ),
 
-    "Vehicles": [
+    "Vehicles": (
         "classic cars", "aviation", "trains", "motorcycles", "ships",
         "space vehicles", "electric cars", "race cars", "submarines",
         "military vehicles", "bicycles", "concept cars",
-    ],
+    ),
 
-    "Entertainment: Comics": [
+    "Entertainment: Comics": (
         "Marvel Comics", "DC Comics", "manga", "graphic novels",
         "comic book artists", "superhero origins", "comic conventions",
         "webcomics", "indie comics", "comic book villains",
         "crossover events", "comic book publishers",
-    ],
+    ),
 
-    "Science: Gadgets": [
+    "Science: Gadgets": (
         "smartphones", "wearable technology", "drones", "virtual reality",
         "3D printing", "smart home", "robotics", "electric vehicles",
         "space technology", "medical devices", "gaming consoles",
         "audio technology",
-    ],
+    ),
 
-    "Entertainment: Japanese Anime & Manga": [
+    "Entertainment: Japanese Anime & Manga": (
         "shonen anime", "studio ghibli", "anime conventions", "manga artists",
         "mecha anime", "anime music", "light novels", "anime awards",
         "cosplay", "anime history", "magical girl anime", "slice of life anime",
-    ],
+    ),
 
-    "Entertainment: Cartoon & Animations": [
+    "Entertainment: Cartoon & Animations": (
         "1990s", "1990s nostalgia", "Nickelodeon", "Cartoon Network",
         "Pixar", "Disney animation", "Cartoon Network originals",
         "adult animation", "stop motion", "anime influence",
         "animation techniques", "voice acting", "Saturday morning cartoons",
         "cartoon reboots",
-    ],
+    ),
 }
 
+_SEEDED_CATEGORIES = tuple(CATEGORIZED_SEEDS)
+
 
 # Modifiers to create context and variation
-MODIFIERS = [
+MODIFIERS = (
     # History & time
     "origin",
     "creation",
@@ -348,14 +365,46 @@ MODIFIERS = [
     "weird",
     "strange",
     "unbelievable",
-]
+)
+
+
+# Seed pools kept between calls, one per (category, words, modifiers); enough for
+# every category under a couple of custom modifier lists
+SEED_POOL_CACHE_SIZE = 64
+
+
+@functools.lru_cache(maxsize=SEED_POOL_CACHE_SIZE)
+def _seed_pool(category: str, words: Tuple[str, ...], mods: Tuple[str, ...]) -> Tuple[SeedResult, ...]:
+    """Every distinct base word x modifier seed, tagged with the given category."""
+    return tuple(
+        SeedResult(seed=f"{base} :: {mod}", category=category)
+        for base in dict.fromkeys(words)
+        for mod in dict.fromkeys(mods)
+    )
+
+
+@functools.lru_cache(maxsize=SEED_POOL_CACHE_SIZE)
+def _default_seed_pool(category: Optional[str]) -> Tuple[SeedResult, ...]:
+    """
+    Every built-in seed for a category (or for all categories if None).
+
+    Built on first use and shares the bounded _seed_pool cache, so only the first
+    exhausted fast path pays for enumerating the base word x modifier product.
+    """
+    if category is not None:
+        return _seed_pool(category, CATEGORIZED_SEEDS[category], MODIFIERS)
+    return tuple(
+        result
+        for cat in _SEEDED_CATEGORIES
+        for result in _seed_pool(cat, CATEGORIZED_SEEDS[cat], MODIFIERS)
+    )
 
 
 def generate_seed(
     *,
     category: Optional[str] = None,
-    base_words: Optional[List[str]] = None,
-    modifiers: Optional[List[str]] = None,
+    base_words: Optional[Sequence[str]] = None,
+    modifiers: Optional[Sequence[str]] = None,
 ) -> SeedResult:
     """
     Generate a unique seed by combining a base word with a modifier.
@@ -369,40 +418,44 @@ def generate_seed(
         SeedResult: Named tuple with (seed, category).
     """
     mods = modifiers if modifiers is not None else MODIFIERS
-    modifier = random.choice(mods)
 
     if base_words is not None:
         # Custom seeds provided — use them directly
         chosen_category = category if category is not None else "General Knowledge"
-        base = random.choice(base_words)
+        words = base_words
     elif category is not None and category in CATEGORIZED_SEEDS:
         # Category specified — pick from that category's seeds
         chosen_category = category
-        base = random.choice(CATEGORIZED_SEEDS[chosen_category])
+        words = CATEGORIZED_SEEDS[chosen_category]
     else:
         # Neither provided — pick a random category, then a random seed from it
-        chosen_category = random.choice(list(CATEGORIZED_SEEDS.keys()))
-        base = random.choice(CATEGORIZED_SEEDS[chosen_category])
+        chosen_category = _choice(_SEEDED_CATEGORIES)
+        words = CATEGORIZED_SEEDS[chosen_category]
 
-    return SeedResult(seed=f"{base} :: {modifier}", category=chosen_category)
+    # One draw over the base word x modifier grid
+    base_index, modifier_index = divmod(_randrange(len(words) * len(mods)), len(mods))
+
+    return SeedResult(seed=f"{words[base_index]} :: {mods[modifier_index]}", category=chosen_category)
 
 
 def get_unused_seed(
-    used_seeds: set,
+    used_seeds: AbstractSet[str],
     *,
     category: Optional[str] = None,
-    base_words: Optional[List[str]] = None,
-    modifiers: Optional[List[str]] = None,
+    base_words: Optional[Sequence[str]] = None,
+    modifiers: Optional[Sequence[str]] = None,
 ) -> SeedResult:
     """
     Get a seed that hasn't been used yet.
 
-    Tries random selection first (fast path). If most seeds are used,
-    enumerates all possibilities to find unused ones. If all seeds exhausted,
+    Tries a few random picks first (fast path) while fewer than half the seeds
+    are used. Otherwise, or if those picks all collide, enumerates all
+    possibilities to find unused ones. If all seeds exhausted,
     logs a warning and returns a random seed.
 
     Args:
-        used_seeds: Set of previously used seeds.
+        used_seeds: Set of previously used seeds (a set, not a list: it is
+            membership-tested once per candidate).
         category: Optional OpenTDB category name.
         base_words: Optional custom list of base words.
         modifiers: Optional custom list of modifiers (defaults to MODIFIERS).
@@ -410,51 +463,56 @@ def get_unused_seed(
     Returns:
         SeedResult: An unused seed.
     """
-    # Fast path: try 100 random seeds
-    for _ in range(100):
-        result = generate_seed(category=category, base_words=base_words, modifiers=modifiers)
-        if result.seed not in used_seeds:
-            return result
+    mods = modifiers if modifiers is not None else MODIFIERS
+
+    # Fast path: a few random picks, only while most seeds are still unused.
+    # len(used_seeds) can include other categories, so this errs towards enumerating.
+    # Sized like the enumerated pool: repeated words and modifiers count once.
+    if base_words is not None:
+        pool_size = get_total_possible_seeds(base_words, modifiers)
+    elif category is not None and category in CATEGORIZED_SEEDS:
+        pool_size = get_total_possible_seeds(CATEGORIZED_SEEDS[category], modifiers)
+    else:
+        pool_size = get_total_possible_seeds(modifiers=modifiers)
+    if len(used_seeds) < pool_size * FAST_PATH_MAX_USED_RATIO:
+        for _ in range(FAST_PATH_ATTEMPTS):
+            result = generate_seed(category=category, base_words=base_words, modifiers=modifiers)
+            if result.seed not in used_seeds:
+                return result
 
     # Slow path: enumerate all possibilities
-    mods = modifiers if modifiers is not None else MODIFIERS
 
     if base_words is not None:
-        words = base_words
         chosen_category = category if category is not None else "General Knowledge"
-        all_seeds = [
-            SeedResult(seed=f"{base} :: {mod}", category=chosen_category)
-            for base in words
-            for mod in mods
-        ]
+        all_seeds = _seed_pool(chosen_category, tuple(base_words), tuple(mods))
+    elif modifiers is None:
+        # Built-in words and modifiers: reuse the enumeration from earlier calls
+        all_seeds = _default_seed_pool(category if category in CATEGORIZED_SEEDS else None)
     elif category is not None and category in CATEGORIZED_SEEDS:
-        words = CATEGORIZED_SEEDS[category]
-        all_seeds = [
-            SeedResult(seed=f"{base} :: {mod}", category=category)
-            for base in words
-            for mod in mods
-        ]
+        all_seeds = _seed_pool(category, CATEGORIZED_SEEDS[category], tuple(mods))
     else:
         all_seeds = [
-            SeedResult(seed=f"{base} :: {mod}", category=cat)
+            result
             for cat, words in CATEGORIZED_SEEDS.items()
-            for base in words
-            for mod in mods
+            for result in _seed_pool(cat, words, tuple(mods))
         ]
 
-    unused = [r for r in all_seeds if r.seed not in used_seeds]
+    # Keyed by seed so repeated words (weighted picks, words shared between
+    # categories) are one candidate each
+    unused = {r.seed: r for r in all_seeds if r.seed not in used_seeds}
 
     if not unused:
         # All seeds exhausted — log warning and return a random seed
         logger.warning("All trivia seeds exhausted. Resetting seed pool.")
         return generate_seed(category=category, base_words=base_words, modifiers=modifiers)
 
-    return random.choice(unused)
+    # Pick by position rather than copying the candidates into a list
+    return next(itertools.islice(unused.values(), _randrange(len(unused)), None))
 
 
 def get_total_possible_seeds(
-    base_words: Optional[List[str]] = None,
-    modifiers: Optional[List[str]] = None,
+    base_words: Optional[Sequence[str]] = None,
+    modifiers: Optional[Sequence[str]] = None,
 ) -> int:
     """
     Get the total number of unique seeds possible.
@@ -467,6 +525,5 @@ def get_total_possible_seeds(
         int: Total combinations.
     """
     mods = modifiers if modifiers is not None else MODIFIERS
-    if base_words is not None:
-        return len(base_words) * len(mods)
-    return sum(len(seeds) for seeds in CATEGORIZED_SEEDS.values()) * len(mods)
+    words = base_words if base_words is not None else [w for seeds in CATEGORIZED_SEEDS.values() for w in seeds]
+    return len(set(words)) * len(set(mods))
@@ -0,0 +1,20 @@
+"""Shared pytest setup for the bot's tests."""
+
+import os
+import shutil
+import tempfile
+
+_runtime_dir = None
+
+
+def pytest_configure(config):
+    """Point the app state file and JSON logs at a temp dir before any bot module is imported."""
+    global _runtime_dir
+    _runtime_dir = tempfile.mkdtemp(prefix="cunningbot-tests-")
+    os.environ["APP_STATE_PATH"] = os.path.join(_runtime_dir, "app_state.json")
+    os.environ["LOG_DIR"] = os.path.join(_runtime_dir, "logs")
+
+
+def pytest_unconfigure(config):
+    if _runtime_dir is not None:
+        shutil.rmtree(_runtime_dir, ignore_errors=True)
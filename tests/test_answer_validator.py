@@ -0,0 +1,124 @@
+"""Tests for trivia answer validation and its verdict cache."""
+
+import pytest
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from bot.domain.trivia import answer_validator
+from bot.domain.trivia.answer_cache import LLMAnswerCache
+from bot.domain.trivia.answer_validator import validate_answer
+
+
+def _chat_reply(content: str) -> SimpleNamespace:
+    return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=content))])
+
+
+@pytest.fixture(autouse=True)
+def clear_answer_cache():
+    """Keep cached verdicts from leaking between tests."""
+    answer_validator._answer_cache.clear()
+    yield
+    answer_validator._answer_cache.clear()
+
+
+class TestMultipleChoice:
+    """Test exact matching for questions with options."""
+
+    @pytest.mark.asyncio
+    async def test_correct_option_case_insensitive(self):
+        """The correct option matches regardless of case and whitespace."""
+        result = await validate_answer(" paris ", "Paris", "Capital of France?", ["Paris", "Rome"])
+        assert result == {"is_correct": True, "feedback": "Exact match"}
+
+    @pytest.mark.asyncio
+    async def test_wrong_option_and_non_option(self):
+        """Other options are incorrect; answers outside the options are rejected."""
+        options = ["Paris", "Rome"]
+        assert (await validate_answer("Rome", "Paris", "Q?", options))["feedback"] == "Incorrect option"
+        assert (await validate_answer("Oslo", "Paris", "Q?", options))["feedback"] == "Answer does not match any option"
+
+
+class TestNumericAnswers:
+    """Test that plain numeric answers are judged without the LLM."""
+
+    @pytest.mark.asyncio
+    @patch("bot.api.openai.chat_completions_client.openai")
+    async def test_numbers_compared_locally(self, mock_chat: MagicMock) -> None:
+        """Equal numbers are correct, off-by-one is not, and no LLM call is made."""
+        mock_chat.chat.completions.create = AsyncMock()
+
+        assert (await validate_answer(" 1914 ", "1914", "When did WW1 begin?"))["is_correct"] is True
+        assert (await validate_answer("3.50", "3.5", "Q?"))["is_correct"] is True
+        assert (await validate_answer("1915", "1914", "When did WW1 begin?"))["is_correct"] is False
+
+        mock_chat.chat.completions.create.assert_not_awaited()
+
+
+class TestLLMAnswerCache:
+    """Test the exact-answer verdict cache."""
+
+    def test_exact_hit_ignores_case_and_whitespace(self):
+        """The same answer, differently formatted, hits the exact tier."""
+        cache = LLMAnswerCache()
+        cache.put("Q?", "World War 1", "WW1", {"is_correct": True, "feedback": "ok"})
+        assert cache.get("Q?", "World War 1", "  ww1 ") == {"is_correct": True, "feedback": "ok"}
+        assert cache.get("Other?", "World War 1", "WW1") is None
+
+    def test_expired_entries_miss(self):
+        """Entries older than the TTL are not returned."""
+        cache = LLMAnswerCache(ttl=-1)
+        cache.put("Q?", "A", "a", {"is_correct": True, "feedback": ""})
+        assert cache.get("Q?", "A", "a") is None
+
+
+class TestValidateAnswerCaching:
+    """Test that open-ended validation reuses verdicts."""
+
+    @pytest.mark.asyncio
+    @patch("bot.api.openai.chat_completions_client.openai")
+    async def test_repeat_skips_llm_but_paraphrase_is_judged(self, mock_chat: MagicMock) -> None:
+        """A repeated answer reuses its verdict; a different wording goes to the LLM."""
+        mock_chat.chat.completions.create = AsyncMock(side_effect=[
+            _chat_reply('{"is_correct": true, "feedback": "Same war"}'),
+            _chat_reply('{"is_correct": false, "feedback": "Wrong war"}'),
+        ])
+
+        first = await validate_answer("First World War", "World War I", "Which war began in 1914?")
+        repeat = await validate_answer("first world war", "World War I", "Which war began in 1914?")
+        other = await validate_answer("World War II", "World War I", "Which war began in 1914?")
+
+        assert first == repeat == {"is_correct": True, "feedback": "Same war"}
+        assert other == {"is_correct": False, "feedback": "Wrong war"}
+        assert mock_chat.chat.completions.create.await_count == 2
+        kwargs = mock_chat.chat.completions.create.await_args.kwargs
+        assert kwargs["response_format"] == {"type": "json_object"}
+        assert kwargs["max_completion_tokens"] == answer_validator.JUDGE_MAX_TOKENS
+        assert kwargs["temperature"] == 0
+
+    @pytest.mark.asyncio
+    @patch("bot.api.openai.chat_completions_client.openai")
+    async def test_feedback_with_braces_is_parsed(self, mock_chat: MagicMock) -> None:
+        """Braces inside the judge's feedback don't break parsing."""
+        mock_chat.chat.completions.create = AsyncMock(
+            return_value=_chat_reply('Verdict: {"is_correct": false, "feedback": "Expected {1914}"} thanks')
+        )
+
+        result = await validate_answer("in 1915", "1914", "When did WW1 begin?")
+
+        assert result == {"is_correct": False, "feedback": "Expected {1914}"}
+
+    @pytest.mark.asyncio
+    @patch("bot.api.openai.chat_completions_client.openai")
+    async def test_unparseable_reply_not_cached(self, mock_chat: MagicMock) -> None:
+        """Fallback verdicts are not cached, so the next attempt asks the LLM again."""
+        mock_chat.chat.completions.create = AsyncMock(return_value=_chat_reply("no json"))
+
+        result = await validate_answer("Paris", "paris", "Capital of France?")
+        await validate_answer("Paris", "paris", "Capital of France?")
+
+        assert result == {"is_correct": True, "feedback": "Validation error - using exact match"}
+        assert mock_chat.chat.completions.create.await_count == 2
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
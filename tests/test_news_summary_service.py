@@ -0,0 +1,407 @@
+"""Tests for the pure helpers in news_summary_service."""
+
+import pytest
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import httpx
+import openai
+
+from bot.domain.news.news_summary_service import (
+    _LLM_RESPONSE_CACHE,
+    _chat,
+    _dedup_articles,
+    _extract_json_object,
+    _fit_to_token_budget,
+    _normalize_articles,
+    _parse_story_summary,
+    _quick_novelty,
+    batch_check_story_similarity,
+    filter_articles_by_instructions,
+    generate_summary_text,
+    parse_ranking_response,
+    rank_and_cluster_articles,
+    rank_articles_by_embedding,
+    rank_articles_by_importance,
+    reorder_articles,
+)
+
+
+@pytest.fixture(autouse=True)
+def clear_llm_response_cache():
+    """Keep cached LLM replies from leaking between tests."""
+    _LLM_RESPONSE_CACHE.clear()
+    yield
+    _LLM_RESPONSE_CACHE.clear()
+
+
+class TestParseRankingResponse:
+    """Test parsing of the LLM ranking response."""
+
+    def test_comma_separated_numbers(self):
+        """A plain comma-separated list maps to 0-based indices."""
+        assert parse_ranking_response("3,1,7,2,5") == [2, 0, 6, 1, 4]
+
+    def test_ignores_surrounding_text(self):
+        """Numbers embedded in prose are still extracted in order."""
+        assert parse_ranking_response('Ranking: "2, 1, 3"') == [1, 0, 2]
+
+    def test_no_numbers_raises(self):
+        """A response without any numbers is rejected."""
+        with pytest.raises(ValueError):
+            parse_ranking_response("no ranking here")
+
+
+class TestExtractJsonObject:
+    """Test pulling a JSON object out of an LLM reply."""
+
+    def test_nested_object(self):
+        """Nested braces are kept balanced."""
+        reply = 'Here: {"ranking": [1], "clusters": {"cluster_1": [1]}} done'
+        assert _extract_json_object(reply) == '{"ranking": [1], "clusters": {"cluster_1": [1]}}'
+
+    def test_braces_inside_strings_ignored(self):
+        """Braces and escaped quotes inside string values don't end the object."""
+        reply = '{"has_significant_updates": true, "reason": "new \\"} figures\\" {x"} trailing }'
+        assert _extract_json_object(reply) == '{"has_significant_updates": true, "reason": "new \\"} figures\\" {x"}'
+
+    def test_no_object(self):
+        """Unbalanced or missing objects return None."""
+        assert _extract_json_object("no json") is None
+        assert _extract_json_object('{"a": 1') is None
+
+
+class TestReorderArticles:
+    """Test reordering articles by ranking indices."""
+
+    def test_follows_ranking_and_appends_unranked(self):
+        """Ranked articles come first, unranked ones keep their original order."""
+        articles = [{"id": i} for i in range(4)]
+        result = reorder_articles(articles, [2, 0])
+        assert [a["id"] for a in result] == [2, 0, 1, 3]
+
+    def test_skips_out_of_range_and_duplicate_indices(self):
+        """Invalid and repeated indices never produce extra entries."""
+        articles = [{"id": i} for i in range(3)]
+        result = reorder_articles(articles, [1, 1, 9, -1, 0])
+        assert [a["id"] for a in result] == [1, 0, 2]
+
+
+class TestDedupArticles:
+    """Test removal of repeated articles before LLM calls."""
+
+    def test_drops_same_canonical_url(self):
+        """Tracking params and host case do not make a URL unique."""
+        articles = [
+            {"title": "First story", "link": "https://Example.com/a?utm_source=rss"},
+            {"title": "Completely different words", "link": "https://example.com/a"},
+        ]
+        assert [a["title"] for a in _dedup_articles(articles)] == ["First story"]
+
+    def test_drops_identical_titles_from_other_sources(self):
+        """Syndicated copies with the same headline are collapsed."""
+        articles = [
+            {"title": "Fed raises interest rates by half a point", "link": "https://a.com/1"},
+            {"title": "Fed Raises Interest Rates By Half A Point", "link": "https://b.com/2"},
+            {"title": "Apple launches a new phone", "link": "https://c.com/3"},
+        ]
+        result = _dedup_articles(articles)
+        assert [a["link"] for a in result] == ["https://a.com/1", "https://c.com/3"]
+
+    def test_generic_titles_deduped_by_url_only(self):
+        """Short or placeholder titles never make distinct links duplicates."""
+        articles = _normalize_articles([
+            {"title": "Live updates", "link": "https://a.com/live"},
+            {"title": "Live updates", "link": "https://b.com/live"},
+            {"link": "https://a.com/1"},
+            {"link": "https://b.com/2"},
+        ])
+        assert len(_dedup_articles(articles)) == 4
+
+
+class TestFitToTokenBudget:
+    """Test sharing a prompt token budget between descriptions."""
+
+    @patch("bot.domain.news.news_summary_service._encoding", return_value=None)
+    def test_short_texts_kept_and_leftover_given_to_long(self, _mock_encoding: MagicMock) -> None:
+        """Short texts stay whole; long ones split what is left (4 chars/token estimate)."""
+        texts = ["tiny", "x" * 400, "y" * 400]
+        fitted = _fit_to_token_budget(texts, 41)
+        assert fitted == ["tiny", "x" * 80, "y" * 80]
+
+    @patch("bot.domain.news.news_summary_service._encoding", return_value=None)
+    def test_no_budget_empties_texts(self, _mock_encoding: MagicMock) -> None:
+        """A non-positive budget leaves nothing of any description."""
+        assert _fit_to_token_budget(["abc", "def"], -5) == ["", ""]
+
+
+class TestQuickNovelty:
+    """Test the term-overlap pre-check for story updates."""
+
+    POSTED = {"title": "Storm floods coastal towns", "summary": "Heavy storm floods coastal towns overnight."}
+
+    def test_repeat_headline_is_not_an_update(self):
+        """Headlines made of already-posted terms are a repeat."""
+        assert _quick_novelty([{"title": "Storm floods coastal towns"}], self.POSTED) is False
+
+    def test_reworded_repeat_defers_to_llm(self):
+        """Another outlet's wording of the same story is not decided locally."""
+        posted = {"title": "Fed raises interest rates by a quarter point", "summary": ""}
+        articles = [
+            {"title": "Federal Reserve hikes rates again as inflation lingers"},
+            {"title": "Powell: Fed lifts benchmark by 25 basis points"},
+        ]
+        assert _quick_novelty(articles, posted) is None
+
+    def test_borderline_defers_to_llm(self):
+        """A headline with a few new terms is left undecided."""
+        articles = [{"title": "Storm floods coastal towns overnight, heavy rainfall"}]
+        assert _quick_novelty(articles, self.POSTED) is None
+
+
+class TestParseStorySummary:
+    """Test parsing TITLE/SUMMARY responses into story summaries."""
+
+    def _cluster(self):
+        return {"articles": [
+            {"title": "Orig", "description": "Original description", "link": "https://a", "source": "A"},
+            {"title": "Dup", "description": "", "link": "https://a", "source": "B"},
+        ]}
+
+    def test_parses_labeled_lines(self):
+        """Title and summary come from their labeled lines; links are deduplicated."""
+        result = _parse_story_summary("TITLE: Big news\nSUMMARY: It happened.\n", self._cluster())
+        assert result["title"] == "Big news"
+        assert result["summary"] == "It happened."
+        assert result["links"] == [{"source": "A", "url": "https://a"}]
+
+    def test_falls_back_to_first_article(self):
+        """Missing labels fall back to the first article's fields."""
+        result = _parse_story_summary("There was an error", self._cluster())
+        assert result["title"] == "Orig"
+        assert result["summary"] == "Original description"
+
+
+class TestGenerateSummaryText:
+    """Test Discord formatting of story summaries."""
+
+    def test_formats_title_summary_and_links(self):
+        """Each story is a bold title, summary and bullet-joined links, blank-line separated."""
+        stories = [
+            {"title": "T1", "summary": "S1", "links": [{"source": "A", "url": "u"}, {"source": "B", "url": "v"}]},
+            {"title": "T2", "summary": "S2", "links": []},
+        ]
+        text = generate_summary_text(stories)
+        assert text == "**Top Stories:**\n\n**T1**\nS1\n[A](u) • [B](v)\n\n**T2**\nS2\n\n"
+
+
+class TestRankArticlesByEmbedding:
+    """Test embedding-based article ranking."""
+
+    @pytest.mark.asyncio
+    @patch("bot.api.openai.embeddings_client.openai")
+    async def test_central_article_ranks_first(self, mock_openai: MagicMock) -> None:
+        """The article closest to the batch centroid outranks outliers."""
+        vectors = [[1.0, 0.0], [0.7, 0.7], [0.0, 1.0]]
+        mock_openai.embeddings.create = AsyncMock(return_value=SimpleNamespace(
+            data=[SimpleNamespace(index=i, embedding=v) for i, v in enumerate(vectors)]
+        ))
+        articles = [
+            {"title": f"Story {i}", "description": "", "link": "", "source": "Test"}
+            for i in range(3)
+        ]
+
+        result = await rank_articles_by_embedding(articles)
+
+        assert result[0]["title"] == "Story 1"
+        mock_openai.embeddings.create.assert_awaited_once()
+
+
+class TestRankArticlesByImportance:
+    """Test LLM ranking of a recency-sorted article list."""
+
+    @pytest.mark.asyncio
+    @patch("bot.domain.news.news_summary_service._encoding", return_value=None)
+    @patch("bot.api.openai.chat_completions_client.openai")
+    async def test_ranks_top_n_and_keeps_recency_order_for_rest(
+        self, mock_openai: MagicMock, _mock_encoding: MagicMock
+    ) -> None:
+        """Only top_n picks are requested; unranked articles follow newest first."""
+        reply = SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content="3"))])
+        mock_openai.chat.completions.create = AsyncMock(return_value=reply)
+        articles = [
+            {"title": f"Day {day}", "description": "", "link": "", "source": "Test",
+             "published": f"2024-01-0{day}T00:00:00"}
+            for day in (1, 3, 2)
+        ]
+
+        result = await rank_articles_by_importance(articles, top_n=1)
+
+        # Listed to the model as Day 3, Day 2, Day 1, so "3" picks Day 1
+        assert [a["title"] for a in result] == ["Day 1", "Day 3", "Day 2"]
+        kwargs = mock_openai.chat.completions.create.await_args.kwargs
+        assert kwargs["max_completion_tokens"] == 8
+        assert "the 1 most important" in list(kwargs["messages"])[-1]["content"]
+
+
+class TestRankAndClusterArticles:
+    """Test the fused rank + cluster LLM call."""
+
+    @pytest.mark.asyncio
+    @patch("bot.domain.news.news_summary_service.RANKING_STRATEGY", "llm")
+    @patch("bot.domain.news.news_summary_service._encoding", return_value=None)
+    @patch("bot.api.openai.chat_completions_client.openai")
+    async def test_one_call_returns_top_articles_and_clusters(
+        self, mock_openai: MagicMock, _mock_encoding: MagicMock
+    ) -> None:
+        """Clusters only contain top-N articles and a single request is made."""
+        content = '{"ranking": [2, 3, 1], "clusters": {"cluster_1": [2, 1], "cluster_2": [3]}}'
+        reply = SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=content))])
+        mock_openai.chat.completions.create = AsyncMock(return_value=reply)
+        articles = [
+            {"title": f"Story {i}", "description": "", "link": "", "source": "Test"}
+            for i in (1, 2, 3)
+        ]
+
+        top_articles, clusters = await rank_and_cluster_articles(articles, top_n=2, max_clusters=5)
+
+        assert [a["title"] for a in top_articles] == ["Story 2", "Story 3"]
+        assert [[a["title"] for a in c["articles"]] for c in clusters] == [["Story 2"], ["Story 3"]]
+        mock_openai.chat.completions.create.assert_awaited_once()
+
+
+class TestFilterArticlesByInstructions:
+    """Test concurrent per-feed filtering."""
+
+    @pytest.mark.asyncio
+    @patch("bot.api.openai.chat_completions_client.openai")
+    async def test_failed_feed_keeps_its_articles(self, mock_openai: MagicMock) -> None:
+        """A feed whose filter call fails keeps everything; other feeds are still filtered."""
+        read = []
+        streams = []
+
+        class FakeStream:
+            def __init__(self, chunks):
+                self.chunks = chunks
+                self.closed = False
+
+            async def __aiter__(self):
+                for chunk in self.chunks:
+                    read.append(chunk)
+                    yield SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content=chunk))])
+
+            async def close(self):
+                self.closed = True
+
+        async def create(messages, **kwargs):
+            prompt = list(messages)[-1]["content"]
+            if "tech only" in prompt:
+                streams.append(FakeStream(["[", "2]", " because it is about tech"]))
+                return streams[-1]
+            raise ValueError("bad request")
+
+        mock_openai.chat.completions.create = AsyncMock(side_effect=create)
+        articles = [
+            {"title": f"{feed} {i}", "description": "", "feed_name": feed}
+            for feed in ("A", "B", "C")
+            for i in (1, 2)
+        ]
+
+        result = await filter_articles_by_instructions(articles, {"A": "tech only", "B": "sports only"})
+
+        assert [a["title"] for a in result] == ["A 2", "B 1", "B 2", "C 1", "C 2"]
+        # Reading stops once the JSON array is complete, and the response is closed
+        assert read == ["[", "2]"]
+        assert [stream.closed for stream in streams] == [True]
+
+
+class TestBatchCheckStorySimilarity:
+    """Test checking all new stories against history in one call."""
+
+    @pytest.mark.asyncio
+    @patch("bot.api.openai.chat_completions_client.openai")
+    async def test_maps_each_new_title_to_history(self, mock_openai: MagicMock) -> None:
+        """Matches resolve to history entries; nulls and bad indices mean unique."""
+        reply = SimpleNamespace(choices=[SimpleNamespace(
+            message=SimpleNamespace(content='{"1": 2, "2": null, "3": 9}')
+        )])
+        mock_openai.chat.completions.create = AsyncMock(return_value=reply)
+        history = [{"title": "Old A"}, {"title": "Old B"}]
+
+        result = await batch_check_story_similarity(
+            ["New 1", "New 2", "New 3"], ["Old A", "Old B"], history
+        )
+
+        assert result == [history[1], None, None]
+        mock_openai.chat.completions.create.assert_awaited_once()
+
+
+class TestChatErrors:
+    """Test that LLM errors reach the caller's fallback."""
+
+    @pytest.mark.asyncio
+    @patch("bot.api.openai.chat_completions_client.openai")
+    async def test_transient_error_not_retried_again(self, mock_openai: MagicMock) -> None:
+        """Errors left after the SDK's own retries are raised without another round."""
+        request = httpx.Request("POST", "https://api.openai.com/v1/chat/completions")
+        mock_openai.chat.completions.create = AsyncMock(side_effect=openai.APIConnectionError(request=request))
+
+        with pytest.raises(openai.APIConnectionError):
+            await _chat([{"role": "user", "content": "rank"}])
+        assert mock_openai.chat.completions.create.await_count == 1
+
+    @pytest.mark.asyncio
+    @patch("bot.api.openai.chat_completions_client.openai")
+    async def test_non_transient_error_raised_immediately(self, mock_openai: MagicMock) -> None:
+        """Other errors are not retried and reach the caller's fallback."""
+        mock_openai.chat.completions.create = AsyncMock(side_effect=ValueError("bad request"))
+
+        with pytest.raises(ValueError):
+            await _chat([{"role": "user", "content": "rank"}])
+        assert mock_openai.chat.completions.create.await_count == 1
+
+
+class TestChatCache:
+    """Test the in-process LLM reply cache."""
+
+    @pytest.mark.asyncio
+    @patch("bot.api.openai.chat_completions_client.openai")
+    async def test_repeated_prompt_served_from_cache(self, mock_openai: MagicMock) -> None:
+        """The same messages only reach the API once; different ones do not hit."""
+        reply = SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content="ok"))])
+        mock_openai.chat.completions.create = AsyncMock(return_value=reply)
+
+        assert await _chat([{"role": "user", "content": "a"}]) == "ok"
+        assert await _chat([{"role": "user", "content": "a"}]) == "ok"
+        await _chat([{"role": "user", "content": "b"}])
+
+        assert mock_openai.chat.completions.create.await_count == 2
+
+    @pytest.mark.asyncio
+    @patch("bot.api.openai.chat_completions_client.openai")
+    async def test_empty_reply_not_cached(self, mock_openai: MagicMock) -> None:
+        """An empty reply is asked for again rather than served from the cache."""
+        reply = SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=""))])
+        mock_openai.chat.completions.create = AsyncMock(return_value=reply)
+
+        await _chat([{"role": "user", "content": "a"}])
+        await _chat([{"role": "user", "content": "a"}])
+
+        assert mock_openai.chat.completions.create.await_count == 2
+
+    @pytest.mark.asyncio
+    @patch("bot.domain.news.news_summary_service.LLM_RESPONSE_CACHE_TTL_SECONDS", -1)
+    @patch("bot.api.openai.chat_completions_client.openai")
+    async def test_expired_reply_refetched(self, mock_openai: MagicMock) -> None:
+        """Replies older than the TTL are not reused."""
+        reply = SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content="ok"))])
+        mock_openai.chat.completions.create = AsyncMock(return_value=reply)
+
+        await _chat([{"role": "user", "content": "a"}])
+        await _chat([{"role": "user", "content": "a"}])
+
+        assert mock_openai.chat.completions.create.await_count == 2
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
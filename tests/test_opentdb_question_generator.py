@@ -0,0 +1,62 @@
+"""Tests for OpenTDB question generation and request spacing."""
+
+import pytest
+from unittest.mock import AsyncMock, patch
+
+from bot.api.opentdb import opentdb_client
+from bot.domain.trivia.opentdb_question_generator import generate_trivia_questions_from_opentdb
+
+
+def _raw_questions(difficulty: str, count: int):
+    return [
+        {
+            "question": f"{difficulty} question {i}?",
+            "correct_answer": f"right {i}",
+            "incorrect_answers": [f"wrong {i}a", f"wrong {i}b", f"wrong {i}c"],
+            "category": "History",
+            "difficulty": difficulty,
+        }
+        for i in range(count)
+    ]
+
+
+async def _fake_fetch(amount, category, difficulty=None):
+    return _raw_questions(difficulty, amount)
+
+
+class TestGenerateFromOpenTDB:
+    """Test fetching and building OpenTDB questions."""
+
+    @pytest.mark.asyncio
+    async def test_fetches_each_requested_difficulty_in_order(self):
+        """Only non-zero difficulties are fetched, and questions keep easy/medium/hard order."""
+        with patch.object(opentdb_client.OpenTDBClient, "fetch_questions", AsyncMock(side_effect=_fake_fetch)) as fetch:
+            questions, category_id = await generate_trivia_questions_from_opentdb(2, 0, 1, category_id=23)
+
+        assert category_id == 23
+        assert [call.kwargs["difficulty"] for call in fetch.await_args_list] == ["easy", "hard"]
+        assert [q["difficulty"] for q in questions] == ["easy", "easy", "hard"]
+        for q in questions:
+            assert q["source"] == "opentdb"
+            assert q["category"] == "History"
+            assert q["correct_answer"] in q["options"] and len(q["options"]) == 4
+
+
+class TestRateLimit:
+    """Test process-wide spacing of OpenTDB requests."""
+
+    @pytest.mark.asyncio
+    async def test_waits_only_for_remaining_interval(self):
+        """A request right after another waits out the rest of the interval; a later one doesn't wait."""
+        with patch.object(opentdb_client, "_last_request_at", 100.0), \
+                patch.object(opentdb_client, "time") as clock, \
+                patch.object(opentdb_client.asyncio, "sleep", AsyncMock()) as sleep:
+            clock.monotonic.side_effect = [102.0, 105.5, 200.0, 200.0]
+            await opentdb_client._wait_for_rate_limit()
+            await opentdb_client._wait_for_rate_limit()
+
+        sleep.assert_awaited_once_with(pytest.approx(opentdb_client.MIN_REQUEST_INTERVAL - 2.0))
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
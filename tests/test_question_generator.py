@@ -0,0 +1,214 @@
+"""Tests for LLM trivia question generation."""
+
+import asyncio
+import json
+import pytest
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from bot.domain.trivia import question_generator
+from bot.domain.trivia.question_generator import answer_appears_in_question, generate_trivia_questions, normalize_text
+
+
+def _chat_reply(content: str) -> SimpleNamespace:
+    return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=content))])
+
+
+FACTS = "1. [EASY] Honeybees dance to share where flowers are."
+QUESTIONS = json.dumps({"questions": [{
+    "question": "What do honeybees do to share where flowers are?",
+    "correct_answer": "Dance",
+    "category": "Animals",
+    "explanation": "The waggle dance encodes direction and distance.",
+    "difficulty": "easy",
+}]})
+REVIEW = json.dumps({"reviews": [{"index": 1, "answerable": True}]})
+
+
+async def _reply_by_phase(**kwargs) -> SimpleNamespace:
+    """Answer each pipeline phase by its system prompt, whatever order calls interleave in."""
+    system = list(kwargs["messages"])[0]["content"]
+    if "research assistant" in system:
+        return _chat_reply(FACTS)
+    if "quality reviewer" in system:
+        return _chat_reply(REVIEW)
+    return _chat_reply(QUESTIONS)
+
+
+@pytest.fixture(autouse=True)
+def clear_facts_cache():
+    """Keep cached facts from leaking between tests."""
+    question_generator._FACTS_CACHE.clear()
+    yield
+    question_generator._FACTS_CACHE.clear()
+
+
+class TestNormalizeText:
+    """Test answer/question normalization."""
+
+    def test_keeps_only_ascii_letters_and_digits(self):
+        """Case, punctuation, whitespace and non-ASCII characters are dropped."""
+        assert normalize_text("Hello, World! 123") == "helloworld123"
+        assert normalize_text("Café Über-straße") == "cafberstrae"
+
+    def test_answer_in_question(self):
+        """Only significant (4+ letter) answer words count as leaks."""
+        assert answer_appears_in_question("Which ocean is the Pacific?", "Pacific Ocean")
+        assert not answer_appears_in_question("What is in the sea?", "The sea")
+
+
+class TestGenerateTriviaQuestions:
+    """Test the facts -> questions -> review pipeline."""
+
+    @pytest.mark.asyncio
+    @patch("bot.api.openai.chat_completions_client.openai")
+    async def test_generates_validated_questions(self, mock_openai: MagicMock) -> None:
+        """Questions from the generation call come back validated."""
+        mock_openai.chat.completions.create = AsyncMock(side_effect=[
+            _chat_reply(FACTS), _chat_reply(QUESTIONS), _chat_reply(REVIEW),
+        ])
+
+        questions = await generate_trivia_questions("bees :: behavior", "Animals", easy_count=1)
+
+        assert questions == [{
+            "question": "What do honeybees do to share where flowers are?",
+            "correct_answer": "Dance",
+            "category": "Animals",
+            "explanation": "The waggle dance encodes direction and distance.",
+            "difficulty": "easy",
+        }]
+        generation_kwargs = mock_openai.chat.completions.create.await_args_list[1].kwargs
+        assert generation_kwargs["response_format"] == {"type": "json_object"}
+
+    @pytest.mark.asyncio
+    @patch("bot.api.openai.chat_completions_client.openai")
+    async def test_vague_question_rewritten(self, mock_openai: MagicMock) -> None:
+        """A question the reviewer marks unanswerable is replaced by its rewrite."""
+        mock_openai.chat.completions.create = AsyncMock(side_effect=[
+            _chat_reply(FACTS),
+            _chat_reply(QUESTIONS),
+            _chat_reply(json.dumps({"reviews": [
+                {"index": 1, "answerable": False, "rewritten_question": "How do honeybees tell hivemates where flowers are?"}
+            ]})),
+        ])
+
+        questions = await generate_trivia_questions("bees :: behavior", "Animals", easy_count=1)
+
+        assert questions[0]["question"] == "How do honeybees tell hivemates where flowers are?"
+        assert questions[0]["correct_answer"] == "Dance"
+
+    @pytest.mark.asyncio
+    @patch("bot.api.openai.chat_completions_client.openai")
+    async def test_repeated_seed_reuses_facts(self, mock_openai: MagicMock) -> None:
+        """A seed drawn again skips the facts call; a different seed, however close, does not."""
+        mock_openai.chat.completions.create = AsyncMock(side_effect=[
+            _chat_reply(FACTS), _chat_reply(QUESTIONS), _chat_reply(REVIEW),
+            _chat_reply(QUESTIONS), _chat_reply(REVIEW),
+            _chat_reply(FACTS), _chat_reply(QUESTIONS), _chat_reply(REVIEW),
+        ])
+
+        await generate_trivia_questions("bees :: behavior", "Animals", easy_count=1)
+        await generate_trivia_questions("bees :: behavior", "Animals", easy_count=1)
+        await generate_trivia_questions("honeybees :: behavior", "Animals", easy_count=1)
+
+        assert mock_openai.chat.completions.create.await_count == 8
+
+    @pytest.mark.asyncio
+    @patch("bot.api.openai.chat_completions_client.openai")
+    async def test_empty_facts_retried_and_not_cached(self, mock_openai: MagicMock) -> None:
+        """An empty facts reply is retried rather than cached for later games."""
+        mock_openai.chat.completions.create = AsyncMock(side_effect=[
+            _chat_reply(""), _chat_reply(FACTS), _chat_reply(QUESTIONS), _chat_reply(REVIEW),
+        ])
+
+        questions = await generate_trivia_questions("bees :: behavior", "Animals", easy_count=1)
+
+        assert len(questions) == 1
+        assert mock_openai.chat.completions.create.await_count == 4
+        assert question_generator._FACTS_CACHE == {("bees :: behavior", "Animals"): FACTS}
+
+    @pytest.mark.asyncio
+    @patch("bot.api.openai.chat_completions_client.openai")
+    async def test_same_seed_in_other_category_not_reused(self, mock_openai: MagicMock) -> None:
+        """Cached facts are per category."""
+        mock_openai.chat.completions.create = AsyncMock(side_effect=[
+            _chat_reply(FACTS), _chat_reply(QUESTIONS), _chat_reply(REVIEW),
+            _chat_reply(FACTS), _chat_reply(QUESTIONS), _chat_reply(REVIEW),
+        ])
+
+        await generate_trivia_questions("bees :: behavior", "Animals", easy_count=1)
+        await generate_trivia_questions("bees :: behavior", "Science & Nature", easy_count=1)
+
+        assert mock_openai.chat.completions.create.await_count == 6
+
+    @pytest.mark.asyncio
+    @patch("bot.api.openai.chat_completions_client.openai")
+    async def test_concurrent_same_seed_shares_facts_call(self, mock_openai: MagicMock) -> None:
+        """Two games generating from the same seed at once make one facts call."""
+        mock_openai.chat.completions.create = AsyncMock(side_effect=_reply_by_phase)
+
+        first, second = await asyncio.gather(
+            generate_trivia_questions("bees :: behavior", "Animals", easy_count=1),
+            generate_trivia_questions("bees :: behavior", "Animals", easy_count=1),
+        )
+
+        assert first == second
+        assert mock_openai.chat.completions.create.await_count == 5
+        assert question_generator._FACTS_IN_FLIGHT == {}
+
+    @pytest.mark.asyncio
+    @patch("bot.api.openai.chat_completions_client.openai")
+    async def test_answer_leak_flagged_in_review(self, mock_openai: MagicMock) -> None:
+        """A question containing its answer is flagged to the reviewer, not sent to a separate rewrite call."""
+        leaking = json.dumps({"questions": [{
+            "question": "Which insect, the honeybee, dances to share where flowers are?",
+            "correct_answer": "Honeybee",
+            "explanation": "",
+            "difficulty": "easy",
+        }]})
+        mock_openai.chat.completions.create = AsyncMock(side_effect=[
+            _chat_reply(FACTS), _chat_reply(leaking), _chat_reply(REVIEW),
+        ])
+
+        await generate_trivia_questions("bees :: behavior", "Animals", easy_count=1)
+
+        assert mock_openai.chat.completions.create.await_count == 3
+        review_prompt = list(mock_openai.chat.completions.create.await_args.kwargs["messages"])[1]["content"]
+        assert review_prompt.endswith("Problem: the answer appears in the question text")
+
+    @pytest.mark.asyncio
+    @patch("bot.api.openai.chat_completions_client.openai")
+    async def test_invalid_seed_rejected_without_llm(self, mock_openai: MagicMock) -> None:
+        """Blank or non-printable seeds fail before any LLM call."""
+        mock_openai.chat.completions.create = AsyncMock()
+
+        for seed in ("", "   ", "bees\x00 :: behavior"):
+            with pytest.raises(ValueError):
+                await generate_trivia_questions(seed, "Animals", easy_count=1)
+
+        mock_openai.chat.completions.create.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    @patch("bot.api.openai.chat_completions_client.openai")
+    async def test_sanitized_question_used_for_leak(self, mock_openai: MagicMock) -> None:
+        """The model's own sanitized rewrite replaces a leaking question before review."""
+        leaking = json.dumps({"questions": [{
+            "question": "Which insect, the honeybee, dances to share where flowers are?",
+            "correct_answer": "Honeybee",
+            "explanation": "",
+            "difficulty": "easy",
+            "answer_leaked": True,
+            "question_sanitized": "Which insect dances to share where flowers are?",
+        }]})
+        mock_openai.chat.completions.create = AsyncMock(side_effect=[
+            _chat_reply(FACTS), _chat_reply(leaking), _chat_reply(REVIEW),
+        ])
+
+        questions = await generate_trivia_questions("bees :: behavior", "Animals", easy_count=1)
+
+        assert questions[0]["question"] == "Which insect dances to share where flowers are?"
+        review_prompt = list(mock_openai.chat.completions.create.await_args.kwargs["messages"])[1]["content"]
+        assert "Problem:" not in review_prompt.split("Questions to review:")[1]
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,91 @@
+"""Tests for trivia seed selection."""
+
+import pytest
+from unittest.mock import patch
+
+from bot.domain.trivia import question_seeds
+from bot.domain.trivia.question_seeds import (
+    CATEGORIZED_SEEDS,
+    MODIFIERS,
+    SeedResult,
+    get_total_possible_seeds,
+    get_unused_seed,
+)
+
+
+def _all_seeds(category: str) -> set:
+    return {f"{base} :: {mod}" for base in CATEGORIZED_SEEDS[category] for mod in MODIFIERS}
+
+
+class TestGetUnusedSeed:
+    """Test picking seeds that haven't been used."""
+
+    def test_returns_unused_seed_in_category(self):
+        """A fresh pick is in the requested category and not already used."""
+        result = get_unused_seed(set(), category="Animals")
+        assert isinstance(result, SeedResult)
+        assert result.category == "Animals"
+        assert result.seed in _all_seeds("Animals")
+
+    def test_finds_last_unused_seed(self):
+        """When nearly every seed is used, the one remaining seed is found."""
+        all_seeds = _all_seeds("Animals")
+        remaining = sorted(all_seeds)[0]
+        result = get_unused_seed(all_seeds - {remaining}, category="Animals")
+        assert result == SeedResult(seed=remaining, category="Animals")
+
+    def test_mostly_used_pool_skips_random_picks(self):
+        """Over half the pool used goes straight to enumeration, without random picks."""
+        used = {"alpha :: one", "alpha :: two", "beta :: one"}
+        with patch("bot.domain.trivia.question_seeds.generate_seed") as generate:
+            get_unused_seed(used, base_words=["alpha", "beta"], modifiers=["one", "two"])
+        generate.assert_not_called()
+
+    def test_repeated_words_do_not_inflate_pool_size(self):
+        """Half of the distinct seeds used skips random picks, however often a word repeats."""
+        with patch("bot.domain.trivia.question_seeds.generate_seed") as generate:
+            get_unused_seed({"alpha :: one"}, base_words=["alpha", "alpha", "beta"], modifiers=["one"])
+        generate.assert_not_called()
+
+    def test_custom_words(self):
+        """Custom base words and modifiers are combined directly."""
+        used = {"alpha :: one", "alpha :: two", "beta :: one"}
+        result = get_unused_seed(used, base_words=["alpha", "beta"], modifiers=["one", "two"])
+        assert result == SeedResult(seed="beta :: two", category="General Knowledge")
+
+    def test_weighted_duplicate_words_enumerated_once(self):
+        """A word listed several times is one candidate once the pool is enumerated."""
+        result = get_unused_seed({"alpha :: one"}, base_words=["alpha", "alpha", "beta"], modifiers=["one"])
+        assert result.seed == "beta :: one"
+
+    def test_custom_pool_built_once(self):
+        """Repeated slow-path calls with equal custom lists reuse the enumerated pool."""
+        used = {"alpha :: one", "alpha :: two", "beta :: one"}
+        question_seeds._seed_pool.cache_clear()
+        get_unused_seed(used, base_words=["alpha", "beta"], modifiers=["one", "two"])
+        get_unused_seed(used, base_words=["alpha", "beta"], modifiers=["one", "two"])
+        info = question_seeds._seed_pool.cache_info()
+        assert (info.misses, info.hits) == (1, 1)
+
+    def test_exhausted_pool_still_returns_seed(self):
+        """With every seed used, a (repeated) seed is still returned."""
+        result = get_unused_seed({"alpha :: one"}, base_words=["alpha"], modifiers=["one"])
+        assert result.seed == "alpha :: one"
+
+
+class TestGetTotalPossibleSeeds:
+    """Test counting the seed space."""
+
+    def test_custom_and_default_counts(self):
+        """Custom lists multiply out; defaults cover every category."""
+        assert get_total_possible_seeds(["a", "b"], ["x", "y", "z"]) == 6
+        words = {word for seeds in CATEGORIZED_SEEDS.values() for word in seeds}
+        assert get_total_possible_seeds() == len(words) * len(MODIFIERS)
+
+    def test_repeated_words_counted_once(self):
+        """Repeated words add no extra seeds."""
+        assert get_total_possible_seeds(["a", "a", "b"], ["x", "x"]) == 2
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])